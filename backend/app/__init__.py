@@ -3,4 +3,16 @@ Careerflow Resume Optimization System
 A conversational AI system for resume optimization using specialized agents.
 """
 
+import logging
+
 __version__ = "1.0.0"
+
+# The backend is imported as the top-level "app" package (backend/ on sys.path).
+# Importing it again as "backend.app" loads every module twice and creates
+# duplicate router and storage singletons, so flag it without refusing to load.
+if __name__ != "app":
+    logging.getLogger("careerflow").warning(
+        "Application imported as %r; run from backend/ and import it as 'app' "
+        "to avoid loading its modules twice",
+        __name__,
+    )
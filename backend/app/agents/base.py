@@ -5,16 +5,23 @@ Provides the abstract base class for all specialized agents with common
 functionality for LLM interaction, context management, and result formatting.
 """
 
+import asyncio
 from abc import ABC, abstractmethod
+from contextvars import ContextVar
 from dataclasses import dataclass, field
 from typing import Any
 
-from app.core.llm import get_llm
+from app.core.llm import get_llm, llm_is_closed
 from app.models.conversation import AgentType, Conversation
 from app.models.resume import Resume, ResumeSection
 from langchain_core.language_models import BaseChatModel
 from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
 
+# Receives tokens from the user-facing LLM call of the current request, if set
+token_sink: ContextVar["asyncio.Queue[str] | None"] = ContextVar(
+    "token_sink", default=None
+)
+
 
 @dataclass
 class AgentResult:
@@ -56,7 +63,7 @@ class BaseAgent(ABC):
     @property
     def llm(self) -> BaseChatModel:
         """Lazy initialization of LLM."""
-        if self._llm is None:
+        if self._llm is None or llm_is_closed(self._llm):
             self._llm = get_llm(self.temperature)
         return self._llm
 
@@ -82,6 +89,24 @@ class BaseAgent(ABC):
         """
         pass
 
+    async def prepare(
+        self, user_message: str, context: dict[str, Any]
+    ) -> dict[str, Any]:
+        """
+        Warm up request-specific data before the agent is selected.
+
+        Called speculatively while intent classification is still running, so
+        it must not call the LLM. The default implementation does nothing.
+
+        Args:
+            user_message: The user's message/request.
+            context: Context known before classification.
+
+        Returns:
+            Extra context entries to pass to process() if this agent is chosen.
+        """
+        return {}
+
     @abstractmethod
     def get_system_prompt(self) -> str:
         """Get the system prompt for this agent."""
@@ -92,6 +117,7 @@ class BaseAgent(ABC):
         system_prompt: str,
         user_prompt: str,
         conversation_history: list[tuple[str, str]] | None = None,
+        stream: bool = False,
     ) -> str:
         """
         Invoke the LLM with the given prompts.
@@ -100,6 +126,7 @@ class BaseAgent(ABC):
             system_prompt: System message for the LLM.
             user_prompt: User message/query.
             conversation_history: Optional list of (role, content) tuples.
+            stream: Forward tokens to the active token sink as they arrive.
 
         Returns:
             LLM response content.
@@ -115,6 +142,15 @@ class BaseAgent(ABC):
 
         messages.append(HumanMessage(content=user_prompt))
 
+        sink = token_sink.get()
+        if stream and sink is not None:
+            parts = []
+            async for chunk in self.llm.astream(messages):
+                if chunk.content:
+                    parts.append(chunk.content)
+                    sink.put_nowait(chunk.content)
+            return "".join(parts)
+
         response = await self.llm.ainvoke(messages)
         return response.content
 
@@ -87,7 +87,11 @@ Always explain your reasoning and the specific changes made.
                 reasoning="No company name found in request or context",
             )
 
-        company_info = await self._research_company(target_company)
+        prefetched = context.get("prefetched_company_info")
+        if prefetched and prefetched["company_name"].lower() == target_company.lower():
+            company_info = prefetched["info"]
+        else:
+            company_info = await self._research_company(target_company)
 
         optimization_prompt = self._build_optimization_prompt(
             resume=resume,
@@ -97,7 +101,9 @@ Always explain your reasoning and the specific changes made.
         )
 
         response = await self._invoke_llm(
-            system_prompt=self.get_system_prompt(), user_prompt=optimization_prompt
+            system_prompt=self.get_system_prompt(),
+            user_prompt=optimization_prompt,
+            stream=True,
         )
 
         updated_sections = self._extract_sections_from_response(response, resume)
@@ -128,6 +134,26 @@ Always explain your reasoning and the specific changes made.
             metadata={"target_company": target_company, "company_info": company_info},
         )
 
+    async def prepare(
+        self, user_message: str, context: dict[str, Any]
+    ) -> dict[str, Any]:
+        """Look up cached research for the likely target company."""
+        company_name = context.get("target_company") or self._extract_company_name(
+            user_message
+        )
+        if not company_name:
+            return {}
+
+        company_info = await self._get_cached_company_info(company_name)
+        if not company_info:
+            return {}
+        return {
+            "prefetched_company_info": {
+                "company_name": company_name,
+                "info": company_info,
+            }
+        }
+
     def _extract_company_name(self, message: str) -> str | None:
         """Extract company name from user message."""
         import re
@@ -174,6 +200,21 @@ Always explain your reasoning and the specific changes made.
         Returns:
             Dictionary containing company information.
         """
+        cached_info = await self._get_cached_company_info(company_name)
+        if cached_info:
+            return cached_info
+
+        company_info = await self._web_search_company(company_name)
+
+        if company_info:
+            await self.vector_store.index_company_info(company_name, company_info)
+
+        return company_info
+
+    async def _get_cached_company_info(
+        self, company_name: str
+    ) -> dict[str, Any] | None:
+        """Get previously indexed research for a company, if any."""
         cached_info = await self.vector_store.search_company_info(
             company_name, n_results=1
         )
@@ -183,13 +224,7 @@ Always explain your reasoning and the specific changes made.
             == company_name.lower()
         ):
             return cached_info[0].get("metadata", {})
-
-        company_info = await self._web_search_company(company_name)
-
-        if company_info:
-            await self.vector_store.index_company_info(company_name, company_info)
-
-        return company_info
+        return None
 
     async def _web_search_company(self, company_name: str) -> dict[str, Any]:
         """
@@ -0,0 +1,99 @@
+"""
+Fast-Path Router.
+
+Deterministic keyword classifier that resolves high-signal requests
+("translate to <language>", "optimize for <Company>", pasted job descriptions)
+without an LLM call. Anything ambiguous is left to the LLM classifier.
+"""
+
+import re
+from typing import Any
+
+from app.agents.translation import TranslationAgent
+from app.models.conversation import AgentType
+
+# Only short messages are routed by keyword; longer ones carry enough nuance
+# that the LLM classifier should decide. Pasted job descriptions are exempt.
+FAST_PATH_MAX_LENGTH = 40
+
+# An explicit JD marker anywhere, or a JD section heading starting a line
+RE_JD = re.compile(
+    r"\b(?:job\s+description|jd)\s*:"
+    r"|^[ \t]*(?:requirements?|responsibilities|qualifications)[ \t]*:",
+    re.IGNORECASE | re.MULTILINE,
+)
+RE_TRANSLATE = re.compile(
+    r"\b(?:translate|convert)\b.*?\b(?:to|into)\s+([A-Za-z]+)", re.IGNORECASE
+)
+# The capitalized name must end the message ("optimize my resume for Goldman
+# Sachs"), so "for SEO roles" or "to ATS standards" never match
+RE_COMPANY = re.compile(
+    r"(?i:\b(?:optimi[sz]e|tailor|apply(?:ing)?)\b).*\b(?i:for|to)\s+"
+    r"([A-Z][\w&-]*(?:\s+[A-Z][\w&-]*)*?)\s*[.!]?\s*$"
+)
+
+# Capitalized words that follow "for"/"to" without naming a company
+NON_COMPANY_WORDS = frozenset(
+    "a an ats cv i it junior lead me my senior seo that the this".split()
+)
+
+# Any of these alongside a company match means the user may want localization
+RE_LOCALIZATION_SIGNAL = re.compile(
+    r"\b(?:translat\w*|locali[sz]\w*|market|language|"
+    + "|".join(TranslationAgent.SUPPORTED_LANGUAGES)
+    + r")\b",
+    re.IGNORECASE,
+)
+
+
+def fast_classify(user_message: str) -> tuple[AgentType, dict[str, Any]] | None:
+    """
+    Classify a message using compiled keyword patterns.
+
+    Args:
+        user_message: The user's message.
+
+    Returns:
+        Tuple of (AgentType, extracted_params) when exactly one intent is
+        clearly signalled, otherwise None so the LLM classifier decides.
+        Translation and company requests are only matched in short messages.
+    """
+    candidates: list[tuple[AgentType, dict[str, Any]]] = []
+
+    if RE_JD.search(user_message):
+        candidates.append((AgentType.JOB_MATCHING, {"has_job_description": True}))
+
+    if len(user_message) >= FAST_PATH_MAX_LENGTH:
+        return _single(candidates)
+
+    translate_match = RE_TRANSLATE.search(user_message)
+    if translate_match:
+        language = translate_match.group(1).lower()
+        if language in TranslationAgent.SUPPORTED_LANGUAGES:
+            candidates.append((AgentType.TRANSLATION, {"target_language": language}))
+
+    company_match = RE_COMPANY.search(user_message)
+    if (
+        company_match
+        and company_match.group(1).split()[0].lower() not in NON_COMPANY_WORDS
+        and not RE_LOCALIZATION_SIGNAL.search(user_message)
+    ):
+        # A pasted JD is more specific than a company name (JOB_MATCHING wins)
+        if not candidates:
+            candidates.append(
+                (AgentType.COMPANY_RESEARCH, {"target_company": company_match.group(1)})
+            )
+
+    return _single(candidates)
+
+
+def _single(
+    candidates: list[tuple[AgentType, dict[str, Any]]],
+) -> tuple[AgentType, dict[str, Any]] | None:
+    """Return the only candidate with fast-path metadata, or None if not one."""
+    if len(candidates) != 1:
+        return None
+
+    agent_type, extracted_params = candidates[0]
+    extracted_params.update(confidence=1.0, reasoning="Keyword fast path")
+    return agent_type, extracted_params
@@ -99,7 +99,9 @@ Output Format:
         )
 
         response = await self._invoke_llm(
-            system_prompt=self.get_system_prompt(), user_prompt=optimization_prompt
+            system_prompt=self.get_system_prompt(),
+            user_prompt=optimization_prompt,
+            stream=True,
         )
 
         updated_sections = self._extract_sections_from_response(response, resume)
@@ -5,16 +5,99 @@ Intelligently routes user messages to the appropriate specialized agent
 using LLM-based intent classification for robust, flexible routing.
 """
 
-import json
+import asyncio
+import contextlib
+import hashlib
+import logging
+from collections.abc import AsyncIterator
+from functools import cache
 from typing import Any
 
-from app.agents.base import AgentResult, BaseAgent
+import orjson
+from app.agents.base import AgentResult, BaseAgent, token_sink
 from app.agents.company_research import CompanyResearchAgent
+from app.agents.fast_router import fast_classify
 from app.agents.job_matching import JobMatchingAgent
 from app.agents.translation import TranslationAgent
-from app.core.llm import get_llm
+from app.core.llm import get_llm, llm_is_closed
 from app.models.conversation import AgentType, Conversation
 from app.models.resume import Resume
+from app.services.cache_service import get_redis_client
+from cachetools import LRUCache
+from langchain_core.messages import HumanMessage, SystemMessage
+
+logger = logging.getLogger("careerflow")
+
+_AGENT_MAP: dict[AgentType, type[BaseAgent]] = {
+    AgentType.COMPANY_RESEARCH: CompanyResearchAgent,
+    AgentType.JOB_MATCHING: JobMatchingAgent,
+    AgentType.TRANSLATION: TranslationAgent,
+}
+
+
+@cache
+def _agent_singleton(agent_type: AgentType) -> BaseAgent | None:
+    """Get the process-wide instance of a specialized agent."""
+    agent_class = _AGENT_MAP.get(agent_type)
+    return agent_class() if agent_class else None
+
+
+def _balanced_object_end(text: str, start: int) -> int | None:
+    """Return the index just past the object opened at text[start], if balanced."""
+    depth = 0
+    in_string = False
+    escaped = False
+
+    for i in range(start, len(text)):
+        char = text[i]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char == "{":
+            depth += 1
+        elif char == "}":
+            depth -= 1
+            if depth == 0:
+                return i + 1
+
+    return None
+
+
+def find_json(text: str) -> str | None:
+    """
+    Find the first balanced JSON object in free-form text.
+
+    Scans from each opening brace, tracking depth and skipping braces inside
+    string literals, so nested objects are returned whole. A candidate that
+    does not parse (e.g. a brace quoted in the surrounding prose) is skipped
+    in favour of the next opening brace.
+
+    Args:
+        text: Text that may contain a JSON object.
+
+    Returns:
+        The JSON object substring, or None if no valid object is found.
+    """
+    start = text.find("{")
+    while start != -1:
+        end = _balanced_object_end(text, start)
+        if end is not None:
+            candidate = text[start:end]
+            try:
+                orjson.loads(candidate)
+            except orjson.JSONDecodeError:
+                pass
+            else:
+                return candidate
+        start = text.find("{", start + 1)
+
+    return None
 
 
 class ConversationRouter:
@@ -77,37 +160,50 @@ Respond with ONLY a valid JSON object (no markdown, no explanation):
     }
 }"""
 
+    # Built once so every routing call sends an identical system message
+    ROUTING_SYSTEM_MESSAGE = SystemMessage(content=ROUTING_SYSTEM_PROMPT)
+
+    # The routing response is a small fixed JSON object
+    ROUTING_MAX_TOKENS = 120
+
+    ROUTING_CACHE_SIZE = 4096
+    ROUTING_CACHE_TTL_SECONDS = 3600
+
+    # Agents prepared speculatively while a long message is being classified.
+    # Only agents that override prepare() have anything to warm up.
+    SPECULATIVE_AGENTS = tuple(
+        agent_type
+        for agent_type in (AgentType.JOB_MATCHING, AgentType.COMPANY_RESEARCH)
+        if _AGENT_MAP[agent_type].prepare is not BaseAgent.prepare
+    )
+    SPECULATION_MIN_LENGTH = 200
+
     def __init__(self):
         self._llm = None
         self._routing_llm = None
-        self._agents: dict[AgentType, BaseAgent] = {}
+        self._routing_cache: LRUCache = LRUCache(maxsize=self.ROUTING_CACHE_SIZE)
 
     @property
     def llm(self):
         """Lazy initialization of LLM for agent processing."""
-        if self._llm is None:
+        if self._llm is None or llm_is_closed(self._llm):
             self._llm = get_llm(temperature=0.7)
         return self._llm
 
     @property
     def routing_llm(self):
-        """Lazy initialization of LLM for routing (low temperature for consistency)."""
-        if self._routing_llm is None:
-            self._routing_llm = get_llm(temperature=0.1)
+        """Lazy initialization of LLM for routing (greedy, JSON-only output)."""
+        if self._routing_llm is None or llm_is_closed(self._routing_llm):
+            self._routing_llm = get_llm(
+                temperature=0.0,
+                max_tokens=self.ROUTING_MAX_TOKENS,
+                response_format={"type": "json_object"},
+            )
         return self._routing_llm
 
-    def _get_agent(self, agent_type: AgentType) -> BaseAgent:
-        """Get or create an agent instance."""
-        if agent_type not in self._agents:
-            agent_map = {
-                AgentType.COMPANY_RESEARCH: CompanyResearchAgent,
-                AgentType.JOB_MATCHING: JobMatchingAgent,
-                AgentType.TRANSLATION: TranslationAgent,
-            }
-            agent_class = agent_map.get(agent_type)
-            if agent_class:
-                self._agents[agent_type] = agent_class()
-        return self._agents.get(agent_type)
+    def _get_agent(self, agent_type: AgentType) -> BaseAgent | None:
+        """Get the shared agent instance for an agent type."""
+        return _agent_singleton(agent_type)
 
     async def route(
         self,
@@ -136,16 +232,25 @@ Respond with ONLY a valid JSON object (no markdown, no explanation):
                 metadata={"agent_type": AgentType.ROUTER.value},
             )
 
-        agent_type, extracted_params = await self._classify_intent(
-            user_message, conversation, context
-        )
+        general_result = None
+        fast_result = fast_classify(user_message)
+        if fast_result is not None:
+            agent_type, extracted_params = fast_result
+        else:
+            (
+                agent_type,
+                extracted_params,
+                general_result,
+            ) = await self._classify_with_speculation(
+                user_message, resume, conversation, context
+            )
 
         # Merge extracted params with existing context
         updated_context = {**context, **extracted_params}
 
         # Handle general/unclear queries
         if agent_type is None:
-            return await self._handle_general_query(user_message, resume, conversation)
+            return general_result
 
         agent = self._get_agent(agent_type)
         if not agent:
@@ -169,6 +274,118 @@ Respond with ONLY a valid JSON object (no markdown, no explanation):
                 metadata={"agent_type": agent_type.value},
             )
 
+    async def route_stream(
+        self,
+        user_message: str,
+        resume: Resume | None,
+        conversation: Conversation,
+        context: dict[str, Any],
+    ) -> AsyncIterator[str | AgentResult]:
+        """
+        Route a user message and stream the agent's response as it is generated.
+
+        Yields response text deltas from the agent's user-facing LLM call,
+        followed by the final AgentResult once processing completes.
+
+        Args:
+            user_message: The user's message.
+            resume: The current resume (if any).
+            conversation: The conversation context.
+            context: Additional context.
+        """
+        queue: asyncio.Queue[str | None] = asyncio.Queue()
+        sink_token = token_sink.set(queue)
+        try:
+            task = asyncio.create_task(
+                self.route(user_message, resume, conversation, context)
+            )
+        finally:
+            token_sink.reset(sink_token)
+        task.add_done_callback(lambda _: queue.put_nowait(None))
+
+        try:
+            while (delta := await queue.get()) is not None:
+                yield delta
+            yield task.result()
+        finally:
+            if not task.done():
+                task.cancel()
+
+    async def _classify_with_speculation(
+        self,
+        user_message: str,
+        resume: Resume,
+        conversation: Conversation,
+        context: dict[str, Any],
+    ) -> tuple[AgentType | None, dict[str, Any], AgentResult | None]:
+        """
+        Run intent classification and a speculative general answer concurrently.
+
+        The general answer is only needed when the classifier picks GENERAL, so
+        it is cancelled as soon as a specialized agent is selected. For long
+        messages the likeliest agents also run prepare() in the meantime; the
+        chosen agent's output is merged into extracted_params and the rest are
+        cancelled.
+
+        A routing cache hit skips speculation entirely.
+
+        Returns:
+            Tuple of (AgentType, extracted_params, general AgentResult or None).
+        """
+        cache_key = self._routing_cache_key(user_message, conversation)
+        cached = await self._get_cached_route(cache_key)
+        if cached is not None:
+            agent_type, extracted_params = cached
+            if agent_type is None:
+                general = await self._handle_general_query(
+                    user_message, resume, conversation
+                )
+                return agent_type, extracted_params, general
+            return agent_type, extracted_params, None
+
+        classify_task = asyncio.create_task(
+            self._classify_with_llm(user_message, conversation, cache_key)
+        )
+        general_task = asyncio.create_task(
+            self._handle_general_query(user_message, resume, conversation)
+        )
+        prepare_tasks: dict[AgentType, asyncio.Task] = {}
+        if len(user_message) > self.SPECULATION_MIN_LENGTH:
+            prepare_tasks = {
+                speculative_type: asyncio.create_task(
+                    self._get_agent(speculative_type).prepare(user_message, context)
+                )
+                for speculative_type in self.SPECULATIVE_AGENTS
+            }
+
+        try:
+            agent_type, extracted_params = await classify_task
+        except BaseException:
+            general_task.cancel()
+            for task in prepare_tasks.values():
+                task.cancel()
+            raise
+
+        chosen_task = prepare_tasks.pop(agent_type, None)
+        for task in prepare_tasks.values():
+            task.cancel()
+
+        if agent_type is None:
+            return agent_type, extracted_params, await general_task
+
+        general_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError, Exception):
+            await general_task
+
+        if chosen_task is not None:
+            try:
+                prepared = await chosen_task
+            except Exception as e:
+                logger.warning("Speculative prepare failed: %s", e)
+            else:
+                extracted_params = {**prepared, **extracted_params}
+        return agent_type, extracted_params, None
+
     async def _classify_intent(
         self, user_message: str, conversation: Conversation, context: dict[str, Any]
     ) -> tuple[AgentType, dict[str, Any]]:
@@ -189,21 +406,35 @@ Respond with ONLY a valid JSON object (no markdown, no explanation):
         Returns:
             Tuple of (AgentType, extracted_params dict).
         """
-        recent_messages = conversation.get_history(limit=3)
-        history_context = ""
-        if recent_messages:
-            history_context = "Recent conversation:\n" + "\n".join(
-                f"- {msg.role.value}: {msg.content[:150]}..." for msg in recent_messages
-            )
-
-        # Truncate very long messages (like job descriptions) for routing
-        message_preview = (
-            user_message[:1500] + "..." if len(user_message) > 1500 else user_message
-        )
-
-        routing_prompt = f"""{self.ROUTING_SYSTEM_PROMPT}
+        cache_key = self._routing_cache_key(user_message, conversation)
+        cached = await self._get_cached_route(cache_key)
+        if cached is not None:
+            return cached
+        return await self._classify_with_llm(user_message, conversation, cache_key)
+
+    @staticmethod
+    def _routing_preview(user_message: str) -> str:
+        """Truncate very long messages (like job descriptions) for routing."""
+        return user_message[:1500] + "..." if len(user_message) > 1500 else user_message
+
+    def _routing_cache_key(self, user_message: str, conversation: Conversation) -> str:
+        """Build the routing cache key from the history preview and the message."""
+        history_context = conversation.history_preview(limit=3)
+        message_preview = self._routing_preview(user_message)
+        return hashlib.blake2b(
+            f"{history_context}\0{message_preview}".encode(), digest_size=16
+        ).hexdigest()
+
+    async def _classify_with_llm(
+        self, user_message: str, conversation: Conversation, cache_key: str
+    ) -> tuple[AgentType, dict[str, Any]]:
+        """Classify with the routing LLM and cache the decision under cache_key."""
+        history_context = conversation.history_preview(limit=3)
+        message_preview = self._routing_preview(user_message)
 
-{history_context}
+        # Only the variable part goes in the user turn; the static system prompt
+        # stays a byte-identical prefix the provider can prefix-cache
+        routing_prompt = f"""{history_context}
 
 Current user message:
 \"\"\"
@@ -213,38 +444,95 @@ Current user message:
 Analyze this message and respond with the JSON classification."""
 
         try:
-            response = await self.routing_llm.ainvoke(routing_prompt)
+            response = await self.routing_llm.ainvoke(
+                [self.ROUTING_SYSTEM_MESSAGE, HumanMessage(content=routing_prompt)]
+            )
             result = self._parse_routing_response(response.content)
-            return result
         except Exception as e:
             # Fallback: if LLM routing fails, default to company research
             return AgentType.COMPANY_RESEARCH, {"error": str(e)}
 
+        if not result[1].get("parse_error"):
+            await self._set_cached_route(cache_key, result)
+        return result
+
+    async def _get_cached_route(
+        self, cache_key: str
+    ) -> tuple[AgentType | None, dict[str, Any]] | None:
+        """Look up a routing decision in the local cache, then Redis."""
+        cached = self._routing_cache.get(cache_key)
+        if cached is not None:
+            agent_type, extracted_params = cached
+            return agent_type, dict(extracted_params)
+
+        redis = get_redis_client()
+        if redis is None:
+            return None
+
+        try:
+            raw = await redis.get(f"route:{cache_key}")
+        except Exception as e:
+            logger.warning("Redis read failed: %s", e)
+            return None
+        if raw is None:
+            return None
+
+        try:
+            data = orjson.loads(raw)
+            agent_type = AgentType(data["agent"]) if data["agent"] else None
+            extracted_params = dict(data["params"])
+        except (KeyError, TypeError, ValueError) as e:
+            # orjson.JSONDecodeError and unknown agent names are ValueErrors
+            logger.warning("Dropping corrupt routing cache entry: %s", e)
+            with contextlib.suppress(Exception):
+                await redis.delete(f"route:{cache_key}")
+            return None
+
+        self._routing_cache[cache_key] = (agent_type, extracted_params)
+        return agent_type, dict(extracted_params)
+
+    async def _set_cached_route(
+        self, cache_key: str, result: tuple[AgentType | None, dict[str, Any]]
+    ) -> None:
+        """Store a routing decision locally and, if configured, in Redis."""
+        agent_type, extracted_params = result
+        self._routing_cache[cache_key] = (agent_type, dict(extracted_params))
+
+        redis = get_redis_client()
+        if redis is None:
+            return
+
+        payload = orjson.dumps(
+            {
+                "agent": agent_type.value if agent_type else None,
+                "params": extracted_params,
+            }
+        )
+        try:
+            await redis.setex(
+                f"route:{cache_key}", self.ROUTING_CACHE_TTL_SECONDS, payload
+            )
+        except Exception as e:
+            logger.warning("Redis write failed: %s", e)
+
     def _parse_routing_response(
         self, response_text: str
     ) -> tuple[AgentType, dict[str, Any]]:
         """Parse the LLM routing response and extract agent type and parameters."""
-        # Clean up the response - remove markdown code blocks if present
-        cleaned = response_text.strip()
-        if cleaned.startswith("```"):
-            # Remove markdown code block
-            lines = cleaned.split("\n")
-            cleaned = "\n".join(lines[1:-1] if lines[-1] == "```" else lines[1:])
-
         try:
-            data = json.loads(cleaned)
-        except json.JSONDecodeError:
+            data = orjson.loads(response_text)
+        except orjson.JSONDecodeError:
             # Try to extract JSON from the response
-            import re
-
-            json_match = re.search(r"\{[^{}]*\}", response_text, re.DOTALL)
-            if json_match:
-                try:
-                    data = json.loads(json_match.group())
-                except json.JSONDecodeError:
-                    return AgentType.COMPANY_RESEARCH, {"parse_error": True}
-            else:
+            json_text = find_json(response_text)
+            if json_text is None:
                 return AgentType.COMPANY_RESEARCH, {"parse_error": True}
+            try:
+                data = orjson.loads(json_text)
+            except orjson.JSONDecodeError:
+                return AgentType.COMPANY_RESEARCH, {"parse_error": True}
+
+        if not isinstance(data, dict):
+            return AgentType.COMPANY_RESEARCH, {"parse_error": True}
 
         # Map agent string to AgentType
         agent_mapping = {
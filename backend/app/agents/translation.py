@@ -194,7 +194,9 @@ Output Format:
         )
 
         response = await self._invoke_llm(
-            system_prompt=self.get_system_prompt(), user_prompt=translation_prompt
+            system_prompt=self.get_system_prompt(),
+            user_prompt=translation_prompt,
+            stream=True,
         )
 
         updated_sections = self._extract_sections_from_response(response, resume)
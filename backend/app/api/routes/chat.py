@@ -4,74 +4,75 @@ Chat API Routes.
 Handles the main chat interface for conversational resume optimization.
 """
 
+import asyncio
+from functools import lru_cache
+from typing import Any
 from uuid import uuid4
 
+import orjson
+from app.agents.base import AgentResult
 from app.agents.router import ConversationRouter
-from app.models.chat import AgentAction, ChatRequest, ChatResponse
+from app.models.chat import AgentAction, ChatRequest, ChatResponse, ResumeChange
 from app.models.conversation import (
     AgentType,
     Conversation,
     Message,
     MessageRole,
 )
+from app.models.resume import Resume
 from app.services.firebase_service import (
     get_storage_service,
 )
-from fastapi import APIRouter, HTTPException
+from app.utils.streaming import TokenBatcher
+from fastapi import APIRouter, BackgroundTasks, HTTPException
+from fastapi.responses import Response, StreamingResponse
 
 router = APIRouter(prefix="/chat", tags=["chat"])
 
-_router_instance: ConversationRouter | None = None
-_storage_instance = None
-_conversations: dict[str, Conversation] = {}
-_resumes: dict[str, any] = {}
-
 
+@lru_cache(maxsize=1)
 def get_router() -> ConversationRouter:
     """Get or create the conversation router instance."""
-    global _router_instance
-    if _router_instance is None:
-        _router_instance = ConversationRouter()
-    return _router_instance
+    return ConversationRouter()
 
 
+@lru_cache(maxsize=1)
 def get_storage():
     """Get the storage service instance."""
-    global _storage_instance
-    if _storage_instance is None:
-        _storage_instance = get_storage_service()
-    return _storage_instance
+    return get_storage_service()
 
 
-@router.post("/message", response_model=ChatResponse)
-async def send_message(request: ChatRequest):
-    """
-    Send a message to the chat system and receive a response.
+async def _none() -> None:
+    """Placeholder awaitable for lookups that are skipped."""
+    return None
 
-    The system will:
-    1. Route the message to the appropriate agent
-    2. Process the request with the relevant resume
-    3. Return the optimized resume and explanation
-    """
+
+async def _prepare_turn(
+    request: ChatRequest,
+) -> tuple[Conversation, Resume | None, dict[str, Any]]:
+    """Load the conversation and resume for a request and record the user message."""
     storage = get_storage()
-    conversation_router = get_router()
 
-    if request.conversation_id:
-        conversation = await storage.get_conversation(request.conversation_id)
-        if not conversation:
-            conversation = await storage.create_conversation(
-                user_id="default_user", resume_id=request.resume_id
-            )
-    else:
+    conversation, resume = await asyncio.gather(
+        (
+            storage.get_conversation(request.conversation_id)
+            if request.conversation_id
+            else _none()
+        ),
+        storage.get_resume(request.resume_id) if request.resume_id else _none(),
+    )
+
+    if not conversation:
         conversation = await storage.create_conversation(
             user_id="default_user", resume_id=request.resume_id
         )
 
     if request.resume_id:
         conversation.resume_id = request.resume_id
-
-    resume = None
-    if conversation.resume_id:
+    elif conversation.resume_id:
+        # Always read through storage: the resume can change outside this
+        # conversation (e.g. a revert), and CachedStorage already serves
+        # repeated reads without a Firestore round trip
         resume = await storage.get_resume(conversation.resume_id)
 
     user_message = Message(
@@ -81,12 +82,40 @@ async def send_message(request: ChatRequest):
 
     context = {**conversation.context, **request.context}
 
-    result = await conversation_router.route(
-        user_message=request.message,
-        resume=resume,
-        conversation=conversation,
-        context=context,
-    )
+    return conversation, resume, context
+
+
+async def _persist_turn(conversation: Conversation, resume: Resume | None) -> None:
+    """Write the updated resume and conversation back to storage."""
+    storage = get_storage()
+
+    writes = [storage.update_conversation(conversation)]
+    if resume and hasattr(storage, "update_resume"):
+        writes.append(storage.update_resume(resume))
+    await asyncio.gather(*writes)
+
+
+async def _finalize_turn(
+    conversation: Conversation,
+    resume: Resume | None,
+    result: AgentResult,
+    background: BackgroundTasks | None = None,
+) -> ChatResponse:
+    """
+    Apply the agent result and build the chat response.
+
+    Args:
+        conversation: The conversation for this turn.
+        resume: The resume the agent worked on, if any.
+        result: The agent result to apply.
+        background: When given, the resume and conversation writes are
+            scheduled to run after the response is sent instead of awaited.
+
+    Returns:
+        The chat response for this turn.
+    """
+    storage = get_storage()
+    updated_resume = None
 
     if result.updated_resume and resume:
         version = await storage.create_resume_version(
@@ -99,23 +128,45 @@ async def send_message(request: ChatRequest):
         conversation.current_resume_version = version.version_number
 
         resume.sections = result.updated_sections
-        if hasattr(storage, "update_resume"):
-            await storage.update_resume(resume)
+        updated_resume = resume
 
     # Convert agent_type string to enum
     agent_type_str = result.metadata.get("agent_type", "router")
     agent_type_enum = AgentType(agent_type_str)
 
+    # Build every per-change view in a single pass over result.changes
+    actions_taken = []
+    actions = []
+    resume_changes = []
+    reasoning = result.reasoning or ""
+    for change in result.changes:
+        change_type = change.get("type")
+        section = change.get("section")
+        actions_taken.append({"type": change_type, "section": section})
+        actions.append(
+            AgentAction(
+                agent_type=agent_type_enum,
+                action=change_type or "modify",
+                details=change,
+            )
+        )
+        resume_changes.append(
+            ResumeChange(
+                section=section or "Unknown",
+                original_content=change.get("original_content"),
+                new_content=change.get("new_content", ""),
+                change_type=change_type or "modify",
+                reasoning=reasoning,
+            )
+        )
+
     assistant_message = Message(
         id=str(uuid4()),
         role=MessageRole.ASSISTANT,
         content=result.message,
         agent_type=agent_type_enum,
         reasoning=result.reasoning,
-        actions_taken=[
-            {"type": change.get("type"), "section": change.get("section")}
-            for change in result.changes
-        ],
+        actions_taken=actions_taken,
     )
     conversation.add_message(assistant_message)
 
@@ -128,30 +179,10 @@ async def send_message(request: ChatRequest):
             }
         )
 
-    await storage.update_conversation(conversation)
-
-    actions = [
-        AgentAction(
-            agent_type=agent_type_enum,
-            action=change.get("type", "modify"),
-            details=change,
-        )
-        for change in result.changes
-    ]
-
-    resume_changes = []
-    for change in result.changes:
-        from app.models.chat import ResumeChange
-
-        resume_changes.append(
-            ResumeChange(
-                section=change.get("section", "Unknown"),
-                original_content=change.get("original_content"),
-                new_content=change.get("new_content", ""),
-                change_type=change.get("type", "modify"),
-                reasoning=result.reasoning or "",
-            )
-        )
+    if background is not None:
+        background.add_task(_persist_turn, conversation, updated_resume)
+    else:
+        await _persist_turn(conversation, updated_resume)
 
     return ChatResponse(
         message=result.message,
@@ -165,6 +196,75 @@ async def send_message(request: ChatRequest):
     )
 
 
+def _sse_event(event: str, data: str) -> str:
+    """Format a server-sent event."""
+    return f"event: {event}\ndata: {data}\n\n"
+
+
+@router.post("/message", response_model=ChatResponse)
+async def send_message(
+    request: ChatRequest, background: BackgroundTasks, sync: bool = False
+):
+    """
+    Send a message to the chat system and receive a response.
+
+    The system will:
+    1. Route the message to the appropriate agent
+    2. Process the request with the relevant resume
+    3. Return the optimized resume and explanation
+
+    Conversation and resume writes are completed after the response is sent.
+    Pass `?sync=true` to wait for them before responding.
+    """
+    conversation_router = get_router()
+    conversation, resume, context = await _prepare_turn(request)
+
+    result = await conversation_router.route(
+        user_message=request.message,
+        resume=resume,
+        conversation=conversation,
+        context=context,
+    )
+
+    response = await _finalize_turn(
+        conversation, resume, result, background=None if sync else background
+    )
+    # ChatResponse is already validated; skip FastAPI's response_model pass
+    return Response(content=response.model_dump_json(), media_type="application/json")
+
+
+@router.post("/message/stream")
+async def send_message_stream(request: ChatRequest):
+    """
+    Send a message and stream the agent's response as server-sent events.
+
+    Emits `delta` events with batched response text while the agent is
+    generating, then a single `done` event carrying the full ChatResponse
+    once the result has been persisted.
+    """
+    conversation_router = get_router()
+    conversation, resume, context = await _prepare_turn(request)
+
+    async def event_stream():
+        deltas = conversation_router.route_stream(
+            user_message=request.message,
+            resume=resume,
+            conversation=conversation,
+            context=context,
+        )
+        try:
+            async for item in TokenBatcher(deltas):
+                if isinstance(item, AgentResult):
+                    response = await _finalize_turn(conversation, resume, item)
+                    yield _sse_event("done", response.model_dump_json())
+                else:
+                    yield _sse_event("delta", orjson.dumps({"content": item}).decode())
+        except Exception as e:
+            yield _sse_event("error", orjson.dumps({"detail": str(e)}).decode())
+
+    return StreamingResponse(event_stream(), media_type="text/event-stream")
+
+
 @router.get("/agents")
 async def get_available_agents():
     """Get information about available agents."""
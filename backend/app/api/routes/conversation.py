@@ -6,7 +6,7 @@ Handles conversation history and management.
 
 from app.models.chat import ConversationHistoryResponse
 from app.services.firebase_service import get_storage_service
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Response
 
 router = APIRouter(prefix="/conversation", tags=["conversation"])
 
@@ -20,25 +20,16 @@ async def get_conversation(conversation_id: str):
     if not conversation:
         raise HTTPException(status_code=404, detail="Conversation not found")
 
-    return ConversationHistoryResponse(
+    # The history is already serialized, so skip re-validating it on the way out
+    history = ConversationHistoryResponse.model_construct(
         conversation_id=conversation.id,
-        messages=[
-            {
-                "id": msg.id,
-                "role": msg.role.value,
-                "content": msg.content,
-                "agent_type": msg.agent_type.value if msg.agent_type else None,
-                "reasoning": msg.reasoning,
-                "actions": msg.actions_taken,
-                "created_at": msg.created_at.isoformat(),
-            }
-            for msg in conversation.messages
-        ],
+        messages=conversation.get_serialized_history(),
         resume_id=conversation.resume_id,
         current_version=conversation.current_resume_version,
         created_at=conversation.created_at,
         updated_at=conversation.updated_at,
     )
+    return Response(content=history.model_dump_json(), media_type="application/json")
 
 
 @router.get("/user/{user_id}")
@@ -113,8 +104,8 @@ async def clear_conversation(conversation_id: str):
     if not conversation:
         raise HTTPException(status_code=404, detail="Conversation not found")
 
-    conversation.messages = []
-    await storage.update_conversation(conversation)
+    conversation.clear_messages()
+    await storage.clear_conversation_messages(conversation_id)
 
     return {
         "message": "Conversation cleared",
@@ -4,38 +4,61 @@ Resume API Routes.
 Handles resume upload, parsing, and version management.
 """
 
+import asyncio
+import logging
+from itertools import islice
+
+from app.core.config import get_settings
 from app.models.chat import (
     FileUploadResponse,
     ResumeVersionResponse,
     VersionCompareResponse,
 )
+from app.models.resume import Resume
 from app.services.firebase_service import get_storage_service
 from app.services.resume_parser import ResumeParserService
 from app.services.vector_store import VectorStoreService
-from fastapi import APIRouter, File, Form, HTTPException, UploadFile
+from app.utils.diff import iter_diff
+from fastapi import APIRouter, BackgroundTasks, File, Form, HTTPException, UploadFile
 
 router = APIRouter(prefix="/resume", tags=["resume"])
+logger = logging.getLogger("careerflow")
+
+# Most change hunks returned by a version comparison
+MAX_DIFFERENCES = 20
 
 
 @router.post("/upload", response_model=FileUploadResponse)
 async def upload_resume(
-    file: UploadFile = File(...), user_id: str = Form(default="default_user")
+    background_tasks: BackgroundTasks,
+    file: UploadFile = File(...),
+    user_id: str = Form(default="default_user"),
 ):
     """
     Upload and parse a resume file.
 
     Supports PDF and DOCX formats. The resume will be parsed,
     sections will be extracted, and it will be indexed for search.
+    Indexing finishes after the response is sent; its progress is reported
+    as `indexing_status` in the resume metadata.
     """
     if not file.filename:
         raise HTTPException(status_code=400, detail="No file provided")
 
-    allowed_extensions = ["pdf", "docx"]
-    extension = file.filename.split(".")[-1].lower()
-    if extension not in allowed_extensions:
+    settings = get_settings()
+    extension = file.filename.rpartition(".")[2].lower()
+    if extension not in settings.allowed_extensions:
         raise HTTPException(
             status_code=400,
-            detail=f"Unsupported file type. Allowed: {', '.join(allowed_extensions)}",
+            detail=f"Unsupported file type. Allowed: {', '.join(settings.allowed_extensions)}",
+        )
+
+    # The body is already spooled by now; the app middleware rejects oversize
+    # requests by Content-Length, this catches bodies sent without one
+    max_size_mb = settings.max_file_size_mb
+    if file.size is not None and file.size > max_size_mb * 1024 * 1024:
+        raise HTTPException(
+            status_code=413, detail=f"File too large. Maximum size: {max_size_mb} MB"
         )
 
     parser = ResumeParserService()
@@ -43,10 +66,13 @@ async def upload_resume(
     vector_store = VectorStoreService()
 
     try:
+        # The spooled upload is read in the parser's worker thread, so large
+        # files that rolled over to disk are never copied into memory whole
         resume = await parser.parse_file(
             file=file.file, filename=file.filename, user_id=user_id
         )
 
+        resume.metadata["indexing_status"] = "pending"
         await storage.save_resume(resume)
 
         await storage.create_resume_version(
@@ -57,22 +83,22 @@ async def upload_resume(
             agent_used="upload",
         )
 
-        try:
-            await vector_store.index_resume(resume)
-        except Exception as e:
-            print(f"Warning: Failed to index resume in vector store: {e}")
+        background_tasks.add_task(_index_resume, vector_store, resume)
 
         sections_detected = [section.section_type.value for section in resume.sections]
 
+        # The parser already recorded the counts, reuse them
+        metadata = {
+            key: resume.metadata[key]
+            for key in ("character_count", "sections_count", "indexing_status")
+        }
+
         return FileUploadResponse(
             resume_id=resume.id,
             filename=resume.filename,
-            message=f"Resume uploaded and parsed successfully. Found {len(resume.sections)} sections.",
+            message=f"Resume uploaded and parsed successfully. Found {metadata['sections_count']} sections.",
             sections_detected=sections_detected,
-            metadata={
-                "character_count": len(resume.raw_text),
-                "sections_count": len(resume.sections),
-            },
+            metadata=metadata,
         )
 
     except ValueError as e:
@@ -157,8 +183,7 @@ async def get_resume_version(resume_id: str, version_number: int):
     """Get a specific version of a resume."""
     storage = get_storage_service()
 
-    versions = await storage.get_resume_versions(resume_id)
-    version = next((v for v in versions if v.version_number == version_number), None)
+    version = await storage.get_resume_version_by_number(resume_id, version_number)
 
     if not version:
         raise HTTPException(status_code=404, detail="Version not found")
@@ -178,9 +203,10 @@ async def compare_versions(resume_id: str, version_a: int, version_b: int):
     """Compare two versions of a resume."""
     storage = get_storage_service()
 
-    versions = await storage.get_resume_versions(resume_id)
-    va = next((v for v in versions if v.version_number == version_a), None)
-    vb = next((v for v in versions if v.version_number == version_b), None)
+    va, vb = await asyncio.gather(
+        storage.get_resume_version_by_number(resume_id, version_a),
+        storage.get_resume_version_by_number(resume_id, version_b),
+    )
 
     if not va or not vb:
         raise HTTPException(status_code=404, detail="One or both versions not found")
@@ -217,9 +243,8 @@ async def revert_to_version(resume_id: str, version_number: int):
     if not resume:
         raise HTTPException(status_code=404, detail="Resume not found")
 
-    versions = await storage.get_resume_versions(resume_id)
-    target_version = next(
-        (v for v in versions if v.version_number == version_number), None
+    target_version = await storage.get_resume_version_by_number(
+        resume_id, version_number
     )
 
     if not target_version:
@@ -649,45 +674,32 @@ SUMMARY:
         }
 
 
+async def _index_resume(vector_store: VectorStoreService, resume: Resume) -> None:
+    """Index an uploaded resume and record the outcome in its metadata."""
+    try:
+        await vector_store.index_resume(resume)
+        status = "indexed"
+    except Exception as e:
+        logger.warning("Failed to index resume in vector store: %s", e)
+        status = "failed"
+
+    # Re-read the stored resume so edits made while indexing are not overwritten
+    storage = get_storage_service()
+    current = await storage.get_resume(resume.id)
+    if current is not None and hasattr(storage, "update_resume"):
+        current.metadata["indexing_status"] = status
+        await storage.update_resume(current)
+
+
 def _compute_differences(content_a: str, content_b: str) -> list[dict]:
     """Compute differences between two content strings."""
-    import difflib
-
-    differ = difflib.unified_diff(
-        content_a.splitlines(keepends=True),
-        content_b.splitlines(keepends=True),
-        lineterm="",
+    change_types = {"delete": "removal", "insert": "addition"}
+    runs = iter_diff(
+        content_a.splitlines(keepends=True), content_b.splitlines(keepends=True)
     )
-
-    differences = []
-    current_change = None
-
-    for line in differ:
-        if line.startswith("---") or line.startswith("+++"):
-            continue
-        elif line.startswith("@@"):
-            if current_change:
-                differences.append(current_change)
-            current_change = {"type": "context", "lines": []}
-        elif line.startswith("-"):
-            if current_change is None:
-                current_change = {"type": "removal", "lines": []}
-            current_change["type"] = "removal"
-            current_change["lines"].append(line[1:])
-        elif line.startswith("+"):
-            if current_change is None:
-                current_change = {"type": "addition", "lines": []}
-            if current_change["type"] == "removal":
-                differences.append(current_change)
-                current_change = {"type": "addition", "lines": []}
-            current_change["type"] = "addition"
-            current_change["lines"].append(line[1:])
-        else:
-            if current_change and current_change["lines"]:
-                differences.append(current_change)
-                current_change = {"type": "context", "lines": []}
-
-    if current_change and current_change["lines"]:
-        differences.append(current_change)
-
-    return differences[:20]
+    differences = (
+        {"type": change_types[op], "lines": lines}
+        for op, lines in runs
+        if op != "equal"
+    )
+    return list(islice(differences, MAX_DIFFERENCES))
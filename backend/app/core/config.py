@@ -23,6 +23,10 @@ class Settings(BaseSettings):
     host: str = "0.0.0.0"
     port: int = 8000  # Railway provides PORT env var, we'll handle it in run.py
 
+    # CORS (the bundled frontend is same-origin and needs no entry here)
+    cors_origins: list[str] = Field(default=["http://localhost:8000"])
+    cors_allow_credentials: bool = False
+
     # Groq Configuration (Llama 3.3 70B, Mixtral 8x7B)
     groq_api_key: str = ""
     groq_model: str = "llama-3.3-70b-versatile"
@@ -41,8 +45,13 @@ class Settings(BaseSettings):
     firebase_auth_provider_cert_url: str = "https://www.googleapis.com/oauth2/v1/certs"
     firebase_client_cert_url: str | None = None
 
+    # Cache (optional Redis layer behind the in-process cache)
+    redis_url: str | None = None
+
     # ChromaDB
     chroma_persist_directory: str = "./chroma_db"
+    # Run the embedding model from an int8-quantized copy (requires the onnx package)
+    embedding_quantized: bool = False
 
     # File Upload
     upload_directory: str = "./uploads"
@@ -5,10 +5,55 @@ Provides LLM instances using Groq API (Llama 3.3 70B, Mixtral 8x7B).
 Embeddings are handled directly by ChromaDB's built-in embedding function.
 """
 
+from functools import lru_cache
+from typing import Any
+
+import httpx
+import orjson
 from app.core.config import Settings, get_settings
 from langchain_core.language_models import BaseChatModel
 from langchain_groq import ChatGroq
 
+HTTP_MAX_CONNECTIONS = 200
+HTTP_MAX_KEEPALIVE_CONNECTIONS = 100
+HTTP_TIMEOUT_SECONDS = 60.0
+
+
+@lru_cache(maxsize=1)
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Get the process-wide HTTP client shared by all LLM instances.
+
+    Sharing one connection pool lets every ChatGroq instance reuse kept-alive
+    connections instead of paying a TLS handshake per client.
+    """
+    return httpx.AsyncClient(
+        limits=httpx.Limits(
+            max_connections=HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS,
+        ),
+        timeout=HTTP_TIMEOUT_SECONDS,
+    )
+
+
+async def close_http_client() -> None:
+    """
+    Close the shared HTTP client if it was created.
+
+    Cached LLM instances are dropped with it, since they hold the closed client;
+    objects that kept an LLM re-fetch it once llm_is_closed() reports True.
+    """
+    if get_http_client.cache_info().currsize:
+        await get_http_client().aclose()
+        get_http_client.cache_clear()
+        _get_cached_llm.cache_clear()
+
+
+def llm_is_closed(llm: Any) -> bool:
+    """Check whether an LLM instance holds an HTTP client that has been closed."""
+    client = getattr(llm, "http_async_client", None)
+    return isinstance(client, httpx.AsyncClient) and client.is_closed
+
 
 class LLMFactory:
     """Factory class for creating LLM instances."""
@@ -16,12 +61,16 @@ class LLMFactory:
     def __init__(self, settings: Settings | None = None):
         self.settings = settings or get_settings()
 
-    def create_llm(self, temperature: float = 0.7) -> BaseChatModel:
+    def create_llm(
+        self, temperature: float = 0.7, max_tokens: int = 4096, **model_kwargs: Any
+    ) -> BaseChatModel:
         """
         Create a Groq LLM instance (Llama 3.3 70B or Mixtral 8x7B).
 
         Args:
             temperature: Sampling temperature for generation.
+            max_tokens: Maximum number of tokens to generate.
+            **model_kwargs: Extra request parameters (e.g. response_format).
 
         Returns:
             A LangChain ChatGroq instance.
@@ -39,19 +88,40 @@ class LLMFactory:
             api_key=self.settings.groq_api_key,
             model_name=self.settings.groq_model,
             temperature=temperature,
-            max_tokens=4096,
+            max_tokens=max_tokens,
+            model_kwargs=model_kwargs,
+            http_async_client=get_http_client(),
         )
 
 
-def get_llm(temperature: float = 0.7) -> BaseChatModel:
+def get_llm(
+    temperature: float = 0.7, max_tokens: int = 4096, **model_kwargs: Any
+) -> BaseChatModel:
     """
     Get a Groq LLM instance.
 
     Args:
         temperature: Sampling temperature for generation.
+        max_tokens: Maximum number of tokens to generate.
+        **model_kwargs: Extra request parameters (e.g. response_format).
 
     Returns:
-        A LangChain ChatGroq instance.
+        A LangChain ChatGroq instance, shared by every caller that asks for
+        the same configuration.
     """
+    return _get_cached_llm(
+        temperature,
+        max_tokens,
+        orjson.dumps(model_kwargs, option=orjson.OPT_SORT_KEYS),
+    )
+
+
+@lru_cache(maxsize=16)
+def _get_cached_llm(
+    temperature: float, max_tokens: int, model_kwargs_json: bytes
+) -> BaseChatModel:
+    # model_kwargs may hold nested dicts, so it is keyed by its JSON encoding
     factory = LLMFactory()
-    return factory.create_llm(temperature)
+    return factory.create_llm(
+        temperature, max_tokens, **orjson.loads(model_kwargs_json)
+    )
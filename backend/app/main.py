@@ -4,16 +4,57 @@ Careerflow Resume Optimization System - Main Application.
 A conversational AI system for resume optimization using specialized agents.
 """
 
+import asyncio
+import logging
 import os
+import sys
 from contextlib import asynccontextmanager
 
 from app.api.routes import chat_router, conversation_router, resume_router
 from app.core.config import get_settings
-from fastapi import FastAPI
+from app.core.llm import close_http_client, get_llm
+from app.services.vector_store import VectorStoreService, get_embedding_function
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, JSONResponse
 from fastapi.staticfiles import StaticFiles
 
+logger = logging.getLogger("careerflow")
+
+UPLOAD_PATH = "/api/resume/upload"
+# Allowance for multipart boundaries and part headers on top of the file
+UPLOAD_OVERHEAD_BYTES = 64 * 1024
+
+
+def _configure_logging(debug: bool) -> None:
+    """Attach a single stdout handler to the application logger."""
+    if not logger.handlers:
+        handler = logging.StreamHandler(sys.stdout)
+        handler.setFormatter(
+            logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s")
+        )
+        logger.addHandler(handler)
+        logger.propagate = False
+    logger.setLevel(logging.DEBUG if debug else logging.INFO)
+
+
+def _warm_up_models() -> None:
+    """Load the models and open the vector store before the first request."""
+    try:
+        get_embedding_function()(["warm up"])
+    except Exception as e:
+        logger.warning("Embedding model warm-up failed: %s", e)
+
+    # Chroma shares one system per persist directory, so opening it once here
+    # spares the first upload or search the SQLite and segment setup
+    try:
+        VectorStoreService().client.heartbeat()
+    except Exception as e:
+        logger.warning("Vector store warm-up failed: %s", e)
+
+    if get_settings().groq_api_key:
+        get_llm()
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -22,19 +63,36 @@ async def lifespan(app: FastAPI):
     os.makedirs(settings.upload_directory, exist_ok=True)
     os.makedirs(settings.chroma_persist_directory, exist_ok=True)
 
-    print(f"[START] {settings.app_name} starting...")
-    print(f"[DIR] Upload directory: {settings.upload_directory}")
-    print(f"[DB] ChromaDB directory: {settings.chroma_persist_directory}")
-    print(f"[LLM] Groq ({settings.groq_model})")
+    logger.info("%s starting...", settings.app_name)
+    logger.info("Upload directory: %s", settings.upload_directory)
+    logger.info("ChromaDB directory: %s", settings.chroma_persist_directory)
+    logger.info("LLM: Groq (%s)", settings.groq_model)
+
+    # Runs before serving so no request writes to a collection being rebuilt;
+    # a no-op once the collections match their configured settings
+    try:
+        migrated = await asyncio.to_thread(
+            VectorStoreService().migrate_collection_settings
+        )
+    except Exception as e:
+        logger.warning("Vector store settings migration failed: %s", e)
+    else:
+        if migrated:
+            logger.info("Updated vector store settings: %s", ", ".join(migrated))
+
+    # Warm up in a thread so startup (and health checks) aren't held up
+    app.state.warm_up = asyncio.create_task(asyncio.to_thread(_warm_up_models))
 
     yield
 
-    print("[STOP] Shutting down...")
+    logger.info("Shutting down...")
+    await close_http_client()
 
 
 def create_app() -> FastAPI:
     """Create and configure the FastAPI application."""
     settings = get_settings()
+    _configure_logging(settings.app_debug)
 
     app = FastAPI(
         title=settings.app_name,
@@ -60,12 +118,29 @@ def create_app() -> FastAPI:
 
     app.add_middleware(
         CORSMiddleware,
-        allow_origins=["*"],
-        allow_credentials=True,
-        allow_methods=["*"],
-        allow_headers=["*"],
+        allow_origins=settings.cors_origins,
+        allow_credentials=settings.cors_allow_credentials,
+        allow_methods=["GET", "POST", "DELETE"],
+        allow_headers=["Content-Type", "Authorization"],
     )
 
+    max_upload_bytes = settings.max_file_size_mb * 1024 * 1024 + UPLOAD_OVERHEAD_BYTES
+
+    @app.middleware("http")
+    async def limit_upload_size(request: Request, call_next):
+        """Reject uploads by declared Content-Length before the body is read."""
+        if request.url.path == UPLOAD_PATH:
+            content_length = request.headers.get("content-length", "")
+            if content_length.isdigit() and int(content_length) > max_upload_bytes:
+                return JSONResponse(
+                    status_code=413,
+                    content={
+                        "detail": "File too large. Maximum size: "
+                        f"{settings.max_file_size_mb} MB"
+                    },
+                )
+        return await call_next(request)
+
     app.include_router(chat_router, prefix="/api")
     app.include_router(resume_router, prefix="/api")
     app.include_router(conversation_router, prefix="/api")
@@ -4,7 +4,7 @@ from datetime import UTC, datetime
 from enum import Enum
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
 
 class MessageRole(str, Enum):
@@ -57,9 +57,28 @@ class Conversation(BaseModel):
     created_at: datetime = Field(default_factory=_utc_now)
     updated_at: datetime = Field(default_factory=_utc_now)
 
+    # Bumped by add_message and clear_messages so cached views can tell that
+    # the list changed even when it is the same object at the same length
+    _messages_version: int = PrivateAttr(default=0)
+    # Message list (and its version) the cached serialized history was built from
+    _history_source: list[Message] | None = PrivateAttr(default=None)
+    _history_key: tuple[int, int] | None = PrivateAttr(default=None)
+    _history_cache: list[dict[str, Any]] = PrivateAttr(default_factory=list)
+    # Same for the routing history preview, keyed by (version, length, limit)
+    _preview_source: list[Message] | None = PrivateAttr(default=None)
+    _preview_key: tuple[int, int, int] | None = PrivateAttr(default=None)
+    _preview_cache: str = PrivateAttr(default="")
+
     def add_message(self, message: Message) -> None:
         """Add a message to the conversation."""
         self.messages.append(message)
+        self._messages_version += 1
+        self.updated_at = datetime.now(UTC)
+
+    def clear_messages(self) -> None:
+        """Remove all messages, keeping the conversation context."""
+        self.messages.clear()
+        self._messages_version += 1
         self.updated_at = datetime.now(UTC)
 
     def get_history(self, limit: int | None = None) -> list[Message]:
@@ -68,6 +87,51 @@ class Conversation(BaseModel):
             return self.messages[-limit:]
         return self.messages
 
+    def get_serialized_history(self) -> list[dict[str, Any]]:
+        """
+        Get the message history as API-ready dictionaries.
+
+        The result is cached and only rebuilt when messages are added,
+        cleared or replaced.
+        """
+        key = (self._messages_version, len(self.messages))
+        if self._history_source is not self.messages or self._history_key != key:
+            self._history_cache = [
+                {
+                    "id": msg.id,
+                    "role": msg.role.value,
+                    "content": msg.content,
+                    "agent_type": msg.agent_type.value if msg.agent_type else None,
+                    "reasoning": msg.reasoning,
+                    "actions": msg.actions_taken,
+                    "created_at": msg.created_at.isoformat(),
+                }
+                for msg in self.messages
+            ]
+            self._history_source = self.messages
+            self._history_key = key
+        return self._history_cache
+
+    def history_preview(self, limit: int = 3) -> str:
+        """
+        Get a truncated summary of recent messages for intent routing.
+
+        The result is cached and only rebuilt when messages are added,
+        cleared or replaced.
+        """
+        key = (self._messages_version, len(self.messages), limit)
+        if self._preview_source is not self.messages or self._preview_key != key:
+            recent_messages = self.get_history(limit=limit)
+            self._preview_cache = ""
+            if recent_messages:
+                self._preview_cache = "Recent conversation:\n" + "\n".join(
+                    f"- {msg.role.value}: {msg.content[:150]}..."
+                    for msg in recent_messages
+                )
+            self._preview_source = self.messages
+            self._preview_key = key
+        return self._preview_cache
+
     def get_context_summary(self) -> str:
         """Get a summary of the conversation context."""
         context_parts = []
@@ -1,5 +1,6 @@
 """Services module for business logic."""
 
+from app.services.cache_service import CachedStorage
 from app.services.firebase_service import FirebaseService
 from app.services.resume_parser import ResumeParserService
 from app.services.vector_store import VectorStoreService
@@ -7,5 +8,6 @@ from app.services.vector_store import VectorStoreService
 __all__ = [
     "ResumeParserService",
     "FirebaseService",
+    "CachedStorage",
     "VectorStoreService",
 ]
@@ -0,0 +1,237 @@
+"""
+Storage Cache Service.
+
+Read-through cache in front of the storage service so hot conversations and
+resumes skip Firestore. Uses Redis when REDIS_URL is configured, so every
+worker sees the same copy, and a bounded in-process TTL cache otherwise.
+"""
+
+import logging
+from collections.abc import Awaitable, Callable
+from functools import lru_cache
+from typing import Any, TypeVar
+
+from app.core.config import get_settings
+from app.models.conversation import Conversation
+from app.models.resume import Resume, ResumeVersion
+from cachetools import TTLCache
+from pydantic import BaseModel
+
+logger = logging.getLogger("careerflow")
+
+CACHE_MAX_SIZE = 1024
+CONVERSATION_TTL_SECONDS = 300
+RESUME_TTL_SECONDS = 600
+VERSIONS_TTL_SECONDS = 30
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+@lru_cache
+def get_redis_client():
+    """
+    Get the shared async Redis client.
+
+    Returns None when REDIS_URL is not set or the redis package is missing,
+    in which case callers fall back to in-process caching only.
+    """
+    redis_url = get_settings().redis_url
+    if not redis_url:
+        return None
+
+    try:
+        from redis import asyncio as aioredis
+    except ImportError:
+        logger.warning("redis package not installed, using in-process cache only")
+        return None
+    return aioredis.from_url(redis_url)
+
+
+class CachedStorage:
+    """
+    Caching proxy around a storage service.
+
+    Conversation and resume reads are served from Redis when it is configured,
+    otherwise from the local cache, then from the wrapped storage. The local
+    cache is never consulted alongside Redis, so a worker cannot act on a stale
+    copy that another worker has since replaced. Callers always get their own
+    copy, so mutating a result (e.g. a turn that fails before saving) leaves
+    the cache untouched. Writes go through to the wrapped storage and refresh
+    the cache. Resume version lists are cached locally for a short TTL, indexed
+    by version number. Every other attribute is delegated unchanged.
+    """
+
+    def __init__(self, storage: Any, redis: Any = None):
+        self._storage = storage
+        self._conversations: TTLCache = TTLCache(
+            maxsize=CACHE_MAX_SIZE, ttl=CONVERSATION_TTL_SECONDS
+        )
+        self._resumes: TTLCache = TTLCache(
+            maxsize=CACHE_MAX_SIZE, ttl=RESUME_TTL_SECONDS
+        )
+        self._versions: TTLCache = TTLCache(
+            maxsize=CACHE_MAX_SIZE, ttl=VERSIONS_TTL_SECONDS
+        )
+        self._redis = redis
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._storage, name)
+
+    # ==================== Redis Helpers ====================
+
+    async def _redis_get(self, key: str) -> bytes | None:
+        if self._redis is None:
+            return None
+        try:
+            return await self._redis.get(key)
+        except Exception as e:
+            logger.warning("Redis read failed: %s", e)
+            return None
+
+    async def _redis_set(self, key: str, model: BaseModel, ttl: int) -> None:
+        if self._redis is None:
+            return
+        try:
+            await self._redis.set(key, model.model_dump_json(), ex=ttl)
+        except Exception as e:
+            logger.warning("Redis write failed: %s", e)
+
+    async def _redis_delete(self, key: str) -> None:
+        if self._redis is None:
+            return
+        try:
+            await self._redis.delete(key)
+        except Exception as e:
+            logger.warning("Redis delete failed: %s", e)
+
+    async def _cached_get(
+        self,
+        cache: TTLCache,
+        key: str,
+        redis_key: str,
+        model: type[ModelT],
+        loader: Callable[[str], Awaitable[ModelT | None]],
+    ) -> ModelT | None:
+        """Look a value up in Redis (or the local cache), then storage."""
+        if self._redis is not None:
+            cached = await self._redis_get(redis_key)
+            if cached is not None:
+                return model.model_validate_json(cached)
+        else:
+            value = cache.get(key)
+            if value is not None:
+                return value.model_copy(deep=True)
+
+        value = await loader(key)
+        if value is None:
+            return None
+        await self._store(cache, key, redis_key, value)
+        return value.model_copy(deep=True)
+
+    async def _store(
+        self, cache: TTLCache, key: str, redis_key: str, value: BaseModel
+    ) -> None:
+        if self._redis is not None:
+            await self._redis_set(redis_key, value, int(cache.ttl))
+        else:
+            cache[key] = value.model_copy(deep=True)
+
+    # ==================== Conversation Operations ====================
+
+    async def create_conversation(
+        self, user_id: str, resume_id: str | None = None
+    ) -> Conversation:
+        conversation = await self._storage.create_conversation(
+            user_id=user_id, resume_id=resume_id
+        )
+        await self._store(
+            self._conversations,
+            conversation.id,
+            f"conv:{conversation.id}",
+            conversation,
+        )
+        return conversation
+
+    async def get_conversation(self, conversation_id: str) -> Conversation | None:
+        return await self._cached_get(
+            self._conversations,
+            conversation_id,
+            f"conv:{conversation_id}",
+            Conversation,
+            self._storage.get_conversation,
+        )
+
+    async def update_conversation(self, conversation: Conversation) -> Conversation:
+        conversation = await self._storage.update_conversation(conversation)
+        await self._store(
+            self._conversations,
+            conversation.id,
+            f"conv:{conversation.id}",
+            conversation,
+        )
+        return conversation
+
+    async def add_message_to_conversation(self, conversation_id: str, *args, **kwargs):
+        self._conversations.pop(conversation_id, None)
+        await self._redis_delete(f"conv:{conversation_id}")
+        return await self._storage.add_message_to_conversation(
+            conversation_id, *args, **kwargs
+        )
+
+    async def clear_conversation_messages(self, conversation_id: str) -> None:
+        self._conversations.pop(conversation_id, None)
+        await self._redis_delete(f"conv:{conversation_id}")
+        await self._storage.clear_conversation_messages(conversation_id)
+
+    async def delete_conversation(self, conversation_id: str) -> None:
+        self._conversations.pop(conversation_id, None)
+        await self._redis_delete(f"conv:{conversation_id}")
+        if hasattr(self._storage, "delete_conversation"):
+            await self._storage.delete_conversation(conversation_id)
+        elif hasattr(self._storage, "conversations"):
+            self._storage.conversations.pop(conversation_id, None)
+
+    # ==================== Resume Operations ====================
+
+    async def save_resume(self, resume: Resume) -> Resume:
+        resume = await self._storage.save_resume(resume)
+        await self._store(self._resumes, resume.id, f"resume:{resume.id}", resume)
+        return resume
+
+    async def get_resume(self, resume_id: str) -> Resume | None:
+        return await self._cached_get(
+            self._resumes,
+            resume_id,
+            f"resume:{resume_id}",
+            Resume,
+            self._storage.get_resume,
+        )
+
+    async def update_resume(self, resume: Resume) -> Resume:
+        resume = await self._storage.update_resume(resume)
+        self._versions.pop(resume.id, None)
+        await self._store(self._resumes, resume.id, f"resume:{resume.id}", resume)
+        return resume
+
+    async def create_resume_version(self, resume_id: str, *args, **kwargs):
+        version = await self._storage.create_resume_version(resume_id, *args, **kwargs)
+        self._versions.pop(resume_id, None)
+        return version
+
+    async def get_resume_versions(self, resume_id: str) -> list[ResumeVersion]:
+        versions = self._versions.get(resume_id)
+        if versions is None:
+            loaded = await self._storage.get_resume_versions(resume_id)
+            versions = {v.version_number: v for v in loaded}
+            self._versions[resume_id] = versions
+        return list(versions.values())
+
+    async def get_resume_version_by_number(
+        self, resume_id: str, version_number: int
+    ) -> ResumeVersion | None:
+        versions = self._versions.get(resume_id)
+        if versions is None:
+            return await self._storage.get_resume_version_by_number(
+                resume_id, version_number
+            )
+        return versions.get(version_number)
@@ -5,7 +5,9 @@ Handles all Firebase Firestore operations for storing conversations,
 resumes, and resume versions.
 """
 
+import logging
 from datetime import UTC, datetime
+from functools import lru_cache
 from uuid import uuid4
 
 from app.core.config import get_settings
@@ -17,6 +19,8 @@ from app.models.conversation import (
 )
 from app.models.resume import Resume, ResumeSection, ResumeVersion
 
+logger = logging.getLogger("careerflow")
+
 
 class FirebaseService:
     """Service for Firebase Firestore operations."""
@@ -48,7 +52,7 @@ class FirebaseService:
             self._initialized = True
             return self._db
         except Exception as e:
-            print(f"Firebase initialization failed: {e}")
+            logger.warning("Firebase initialization failed: %s", e)
             return None
 
     @property
@@ -102,6 +106,15 @@ class FirebaseService:
 
         return conversation
 
+    async def clear_conversation_messages(self, conversation_id: str) -> None:
+        """Remove all messages from a conversation, leaving other fields intact."""
+        db = self._get_db()
+        if db:
+            doc_ref = db.collection("conversations").document(conversation_id)
+            doc_ref.update(
+                {"messages": [], "updated_at": datetime.now(UTC).isoformat()}
+            )
+
     async def add_message_to_conversation(
         self,
         conversation_id: str,
@@ -252,10 +265,10 @@ class FirebaseService:
                 )
                 versions = [self._dict_to_version(doc.to_dict()) for doc in docs]
             except Exception as e:
-                print(f"Error fetching resume versions: {e}")
+                logger.error("Error fetching resume versions: %s", e)
                 return []
         except Exception as e:
-            print(f"Error fetching resume versions: {e}")
+            logger.error("Error fetching resume versions: %s", e)
             return []
 
         # Sort in Python to avoid needing composite index
@@ -275,6 +288,43 @@ class FirebaseService:
 
         return self._dict_to_version(doc.to_dict())
 
+    async def get_resume_version_by_number(
+        self, resume_id: str, version_number: int
+    ) -> ResumeVersion | None:
+        """Get a resume version by its version number."""
+        db = self._get_db()
+        if not db:
+            return None
+
+        try:
+            from google.cloud.firestore_v1.base_query import FieldFilter
+
+            docs = list(
+                db.collection("resume_versions")
+                .where(filter=FieldFilter("resume_id", "==", resume_id))
+                .where(filter=FieldFilter("version_number", "==", version_number))
+                .limit(1)
+                .stream()
+            )
+        except ImportError:
+            # Fallback for older versions
+            try:
+                docs = list(
+                    db.collection("resume_versions")
+                    .where("resume_id", "==", resume_id)
+                    .where("version_number", "==", version_number)
+                    .limit(1)
+                    .stream()
+                )
+            except Exception as e:
+                logger.error("Error fetching resume version: %s", e)
+                return None
+        except Exception as e:
+            logger.error("Error fetching resume version: %s", e)
+            return None
+
+        return self._dict_to_version(docs[0].to_dict()) if docs else None
+
     async def _get_next_version_number(self, resume_id: str) -> int:
         """Get the next version number for a resume."""
         versions = await self.get_resume_versions(resume_id)
@@ -442,6 +492,11 @@ class InMemoryStore:
         self.conversations[conversation.id] = conversation
         return conversation
 
+    async def clear_conversation_messages(self, conversation_id: str) -> None:
+        conversation = self.conversations.get(conversation_id)
+        if conversation:
+            conversation.clear_messages()
+
     async def save_resume(self, resume: Resume) -> Resume:
         self.resumes[resume.id] = resume
         return resume
@@ -490,17 +545,25 @@ class InMemoryStore:
             key=lambda v: v.version_number,
         )
 
-
-_storage_instance = None
+    async def get_resume_version_by_number(
+        self, resume_id: str, version_number: int
+    ) -> ResumeVersion | None:
+        return next(
+            (
+                v
+                for v in self.versions.values()
+                if v.resume_id == resume_id and v.version_number == version_number
+            ),
+            None,
+        )
 
 
+@lru_cache(maxsize=1)
 def get_storage_service():
     """Get the appropriate storage service based on configuration (singleton)."""
-    global _storage_instance
-    if _storage_instance is None:
-        firebase_service = FirebaseService()
-        if firebase_service.is_available:
-            _storage_instance = firebase_service
-        else:
-            _storage_instance = InMemoryStore()
-    return _storage_instance
+    firebase_service = FirebaseService()
+    if firebase_service.is_available:
+        from app.services.cache_service import CachedStorage, get_redis_client
+
+        return CachedStorage(firebase_service, get_redis_client())
+    return InMemoryStore()
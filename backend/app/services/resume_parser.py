@@ -5,20 +5,62 @@ Handles parsing of PDF and DOCX resume files, extracting text and
 identifying sections using LLM-based analysis.
 """
 
+import asyncio
+import hashlib
 import io
+import logging
 import re
+import threading
+import zipfile
 from pathlib import Path
 from typing import BinaryIO
 from uuid import uuid4
 
+import orjson
+import pdfplumber
+import pypdfium2 as pdfium
 from app.core.config import get_settings
 from app.core.llm import get_llm
 from app.models.resume import Resume, ResumeSection, SectionType
+from app.services.cache_service import get_redis_client
+from cachetools import LRUCache
+from lxml import etree
+
+logger = logging.getLogger("careerflow")
+
+# WordprocessingML namespace, in lxml's {uri} tag form
+_W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+
+# PDFium is not thread-safe, even across documents, and uploads are parsed
+# in worker threads; serialize every call into it
+_PDFIUM_LOCK = threading.Lock()
+
+# Uploaded documents are untrusted: no entity expansion, no network access
+_DOCX_XML_PARSER = etree.XMLParser(resolve_entities=False, no_network=True)
+
+
+def _docx_text(paragraph: etree._Element) -> str:
+    """Get a paragraph's text, rendering tabs and line breaks like python-docx."""
+    parts = []
+    for node in paragraph.iter(_W + "t", _W + "tab", _W + "br", _W + "cr"):
+        if node.tag == _W + "t":
+            parts.append(node.text or "")
+        elif node.tag == _W + "tab":
+            parts.append("\t")
+        else:
+            parts.append("\n")
+    return "".join(parts)
 
 
 class ResumeParserService:
     """Service for parsing resume files and extracting structured content."""
 
+    SECTION_CACHE_SIZE = 256
+    SECTION_CACHE_TTL_SECONDS = 7 * 24 * 3600
+
+    # Parser instances are per request, so the cache lives on the class
+    _section_cache: LRUCache = LRUCache(maxsize=SECTION_CACHE_SIZE)
+
     SECTION_PATTERNS = {
         SectionType.CONTACT: r"(contact|personal\s*info|email|phone)",
         SectionType.SUMMARY: r"(summary|objective|profile|about)",
@@ -30,6 +72,35 @@ class ResumeParserService:
         SectionType.LANGUAGES: r"(languages|linguistic)",
     }
 
+    # Compiled once, in priority order; the first pattern that matches wins
+    _SECTION_MATCHERS = tuple(
+        (section_type, re.compile(pattern))
+        for section_type, pattern in SECTION_PATTERNS.items()
+    )
+
+    # Section type names the LLM may answer with
+    _TYPE_MAPPING = {
+        "contact": SectionType.CONTACT,
+        "summary": SectionType.SUMMARY,
+        "objective": SectionType.SUMMARY,
+        "profile": SectionType.SUMMARY,
+        "experience": SectionType.EXPERIENCE,
+        "work": SectionType.EXPERIENCE,
+        "employment": SectionType.EXPERIENCE,
+        "education": SectionType.EDUCATION,
+        "skills": SectionType.SKILLS,
+        "technical": SectionType.SKILLS,
+        "projects": SectionType.PROJECTS,
+        "certifications": SectionType.CERTIFICATIONS,
+        "certificates": SectionType.CERTIFICATIONS,
+        "languages": SectionType.LANGUAGES,
+    }
+
+    # Fields of an LLM section block
+    _SECTION_TYPE_RE = re.compile(r"SECTION_TYPE:\s*(\w+)", re.IGNORECASE)
+    _TITLE_RE = re.compile(r"TITLE:\s*(.+?)(?=\n|CONTENT:)", re.IGNORECASE)
+    _CONTENT_RE = re.compile(r"CONTENT:\s*(.+)", re.IGNORECASE | re.DOTALL)
+
     def __init__(self):
         self.settings = get_settings()
 
@@ -56,12 +127,8 @@ class ResumeParserService:
                 f"Allowed: {', '.join(self.settings.allowed_extensions)}"
             )
 
-        if extension == "pdf":
-            raw_text = self._parse_pdf(file)
-        elif extension == "docx":
-            raw_text = self._parse_docx(file)
-        else:
-            raise ValueError(f"Unsupported file type: {extension}")
+        # pdfium and the DOCX XML parse are blocking, keep them off the event loop
+        raw_text = await asyncio.to_thread(self.extract_text, file, extension)
 
         sections = await self._extract_sections(raw_text)
 
@@ -80,38 +147,108 @@ class ResumeParserService:
 
         return resume
 
+    def extract_text(self, file: BinaryIO, extension: str) -> str:
+        """
+        Extract raw text from a resume file synchronously.
+
+        Args:
+            file: File-like object containing the resume.
+            extension: File extension without the dot ("pdf" or "docx").
+
+        Returns:
+            The extracted text.
+
+        Raises:
+            ValueError: If file type is not supported.
+        """
+        if extension == "pdf":
+            return self._parse_pdf(file)
+        if extension == "docx":
+            return self._parse_docx(file)
+        raise ValueError(f"Unsupported file type: {extension}")
+
+    @staticmethod
+    def _is_disk_backed(file: BinaryIO) -> bool:
+        """Tell whether reads from the file are served from disk, not memory."""
+        # SpooledTemporaryFile keeps small uploads in memory until it rolls
+        # over; Starlette's UploadFile checks the same attribute
+        rolled = getattr(file, "_rolled", None)
+        if rolled is not None:
+            return rolled
+        try:
+            file.fileno()
+        except (AttributeError, OSError):
+            return False
+        return True
+
     def _parse_pdf(self, file: BinaryIO) -> str:
         """Extract text from a PDF file."""
-        import pdfplumber
+        # Disk-backed uploads are read block by block as pdfium needs them
+        # instead of being copied into memory first
+        source = file if self._is_disk_backed(file) else file.read()
+
+        try:
+            text_parts = self._extract_pdf_text(source)
+        except pdfium.PdfiumError:
+            # pdfplumber copes with some malformed files pdfium rejects
+            text_parts = self._extract_pdf_text_fallback(source)
+
+        return "\n\n".join(text_parts)
 
+    def _extract_pdf_text(self, source: bytes | BinaryIO) -> list[str]:
+        """Extract per-page text with pdfium's native text layer."""
         text_parts = []
-        file_bytes = file.read()
+        with _PDFIUM_LOCK:
+            pdf = pdfium.PdfDocument(source)
+            try:
+                for page in pdf:
+                    textpage = page.get_textpage()
+                    page_text = textpage.get_text_range()
+                    textpage.close()
+                    page.close()
+                    if page_text:
+                        text_parts.append(page_text.replace("\r\n", "\n"))
+            finally:
+                pdf.close()
+        return text_parts
+
+    def _extract_pdf_text_fallback(self, source: bytes | BinaryIO) -> list[str]:
+        """Extract per-page text with pdfplumber's layout analysis."""
+        if isinstance(source, bytes):
+            source = io.BytesIO(source)
+        else:
+            source.seek(0)
 
-        with pdfplumber.open(io.BytesIO(file_bytes)) as pdf:
+        text_parts = []
+        with pdfplumber.open(source) as pdf:
             for page in pdf.pages:
                 page_text = page.extract_text()
                 if page_text:
                     text_parts.append(page_text)
-
-        return "\n\n".join(text_parts)
+        return text_parts
 
     def _parse_docx(self, file: BinaryIO) -> str:
         """Extract text from a DOCX file."""
-        from docx import Document
-
-        file_bytes = file.read()
-        doc = Document(io.BytesIO(file_bytes))
+        # Reading document.xml directly skips python-docx's object model;
+        # only the main document part carries the resume text
+        with zipfile.ZipFile(file) as archive:
+            with archive.open("word/document.xml") as document_xml:
+                document = etree.parse(document_xml, _DOCX_XML_PARSER)
+        body = document.getroot().find(_W + "body")
 
         text_parts = []
-        for paragraph in doc.paragraphs:
-            if paragraph.text.strip():
-                text_parts.append(paragraph.text)
-
-        for table in doc.tables:
-            for row in table.rows:
-                row_text = " | ".join(
-                    cell.text.strip() for cell in row.cells if cell.text.strip()
+        for paragraph in body.iterfind(_W + "p"):
+            paragraph_text = _docx_text(paragraph)
+            if paragraph_text.strip():
+                text_parts.append(paragraph_text)
+
+        for table in body.iterfind(_W + "tbl"):
+            for row in table.iterfind(_W + "tr"):
+                cell_texts = (
+                    "\n".join(map(_docx_text, cell.iterfind(_W + "p"))).strip()
+                    for cell in row.iterfind(_W + "tc")
                 )
+                row_text = " | ".join(text for text in cell_texts if text)
                 if row_text:
                     text_parts.append(row_text)
 
@@ -127,6 +264,12 @@ class ResumeParserService:
         Returns:
             List of identified resume sections.
         """
+        # Re-uploads of the same file skip the LLM round trip
+        cache_key = hashlib.blake2b(raw_text.encode(), digest_size=16).hexdigest()
+        cached = await self._get_cached_sections(cache_key)
+        if cached is not None:
+            return cached
+
         llm = get_llm(temperature=0.1)
 
         prompt = f"""Analyze the following resume text and identify distinct sections.
@@ -150,11 +293,52 @@ Be thorough and capture all sections present in the resume."""
         response = await llm.ainvoke(prompt)
         sections = self._parse_section_response(response.content)
 
-        if not sections:
+        if sections:
+            await self._set_cached_sections(cache_key, sections)
+        else:
             sections = self._fallback_section_extraction(raw_text)
 
         return sections
 
+    async def _get_cached_sections(self, cache_key: str) -> list[ResumeSection] | None:
+        """Look up parsed sections in the local cache, then Redis."""
+        payload = self._section_cache.get(cache_key)
+        if payload is None:
+            redis = get_redis_client()
+            if redis is None:
+                return None
+            try:
+                payload = await redis.get(f"sections:{cache_key}")
+            except Exception as e:
+                logger.warning("Redis read failed: %s", e)
+                return None
+            if payload is None:
+                return None
+            self._section_cache[cache_key] = payload
+
+        # Fresh models every time, since callers edit sections in place
+        return [ResumeSection.model_validate(data) for data in orjson.loads(payload)]
+
+    async def _set_cached_sections(
+        self, cache_key: str, sections: list[ResumeSection]
+    ) -> None:
+        """Store parsed sections locally and, if configured, in Redis."""
+        payload = orjson.dumps(
+            [section.model_dump(mode="json") for section in sections]
+        )
+        self._section_cache[cache_key] = payload
+
+        redis = get_redis_client()
+        if redis is None:
+            return
+
+        try:
+            await redis.setex(
+                f"sections:{cache_key}", self.SECTION_CACHE_TTL_SECONDS, payload
+            )
+        except Exception as e:
+            logger.warning("Redis write failed: %s", e)
+
     def _parse_section_response(self, response: str) -> list[ResumeSection]:
         """Parse LLM response into ResumeSection objects."""
         sections = []
@@ -166,18 +350,12 @@ Be thorough and capture all sections present in the resume."""
             if not block:
                 continue
 
-            section_type_match = re.search(
-                r"SECTION_TYPE:\s*(\w+)", block, re.IGNORECASE
-            )
-            title_match = re.search(
-                r"TITLE:\s*(.+?)(?=\n|CONTENT:)", block, re.IGNORECASE
-            )
-            content_match = re.search(
-                r"CONTENT:\s*(.+)", block, re.IGNORECASE | re.DOTALL
-            )
+            section_type_match = self._SECTION_TYPE_RE.search(block)
+            title_match = self._TITLE_RE.search(block)
+            content_match = self._CONTENT_RE.search(block)
 
             if section_type_match and content_match:
-                type_str = section_type_match.group(1).lower()
+                type_str = section_type_match.group(1)
                 section_type = self._map_section_type(type_str)
 
                 title = (
@@ -199,23 +377,7 @@ Be thorough and capture all sections present in the resume."""
 
     def _map_section_type(self, type_str: str) -> SectionType:
         """Map a string to SectionType enum."""
-        type_mapping = {
-            "contact": SectionType.CONTACT,
-            "summary": SectionType.SUMMARY,
-            "objective": SectionType.SUMMARY,
-            "profile": SectionType.SUMMARY,
-            "experience": SectionType.EXPERIENCE,
-            "work": SectionType.EXPERIENCE,
-            "employment": SectionType.EXPERIENCE,
-            "education": SectionType.EDUCATION,
-            "skills": SectionType.SKILLS,
-            "technical": SectionType.SKILLS,
-            "projects": SectionType.PROJECTS,
-            "certifications": SectionType.CERTIFICATIONS,
-            "certificates": SectionType.CERTIFICATIONS,
-            "languages": SectionType.LANGUAGES,
-        }
-        return type_mapping.get(type_str.lower(), SectionType.OTHER)
+        return self._TYPE_MAPPING.get(type_str.lower(), SectionType.OTHER)
 
     def _fallback_section_extraction(self, raw_text: str) -> list[ResumeSection]:
         """
@@ -233,8 +395,8 @@ Be thorough and capture all sections present in the resume."""
             line_lower = line.lower().strip()
 
             detected_type = None
-            for section_type, pattern in self.SECTION_PATTERNS.items():
-                if re.search(pattern, line_lower):
+            for section_type, matcher in self._SECTION_MATCHERS:
+                if matcher.search(line_lower):
                     detected_type = section_type
                     break
 
@@ -6,22 +6,128 @@ Uses ChromaDB's built-in embedding function (all-MiniLM-L6-v2 via onnxruntime)
 which is much lighter than sentence-transformers with PyTorch.
 """
 
-from uuid import uuid4
+import asyncio
+import hashlib
+import logging
+import shutil
+from collections.abc import Iterator
+from functools import lru_cache
 
 import chromadb
 from app.core.config import get_settings
 from app.models.resume import Resume
+from chromadb import Collection, Documents, Embeddings
 from chromadb.config import Settings as ChromaSettings
 from chromadb.utils import embedding_functions
+from chromadb.utils.embedding_functions.onnx_mini_lm_l6_v2 import ONNXMiniLM_L6_V2
+
+logger = logging.getLogger("careerflow")
+
+
+class QuantizedMiniLM(ONNXMiniLM_L6_V2):
+    """
+    all-MiniLM-L6-v2 run from a dynamically int8-quantized copy of the model.
+
+    The quantized model is derived once from ChromaDB's ONNX export and stored
+    next to it; the tokenizer files are reused unchanged.
+    """
+
+    DOWNLOAD_PATH = ONNXMiniLM_L6_V2.DOWNLOAD_PATH.with_name(
+        f"{ONNXMiniLM_L6_V2.MODEL_NAME}-int8"
+    )
+
+    def _download_model_if_not_exists(self) -> None:
+        quantized_dir = self.DOWNLOAD_PATH / self.EXTRACTED_FOLDER_NAME
+        if (quantized_dir / "model.onnx").exists():
+            return
+
+        from onnxruntime.quantization import QuantType, quantize_dynamic
+
+        source = ONNXMiniLM_L6_V2()
+        source._download_model_if_not_exists()
+        source_dir = source.DOWNLOAD_PATH / source.EXTRACTED_FOLDER_NAME
+
+        shutil.copytree(
+            source_dir,
+            quantized_dir,
+            ignore=shutil.ignore_patterns("model.onnx"),
+            dirs_exist_ok=True,
+        )
+        quantize_dynamic(
+            source_dir / "model.onnx",
+            quantized_dir / "model.onnx",
+            weight_type=QuantType.QInt8,
+        )
+
+
+class MiniLMEmbeddingFunction(embedding_functions.DefaultEmbeddingFunction):
+    """
+    ChromaDB's default embedding function backed by one persistent model.
+
+    The upstream default builds a new ONNX session on every call. This keeps
+    a single session for the process and reports itself as "default", so it
+    stays compatible with existing collections.
+    """
+
+    def __init__(self, quantized: bool = False):
+        super().__init__()
+        self._model = QuantizedMiniLM() if quantized else ONNXMiniLM_L6_V2()
+
+    def __call__(self, input: Documents) -> Embeddings:
+        return self._model(input)
+
+
+@lru_cache(maxsize=1)
+def get_embedding_function() -> MiniLMEmbeddingFunction:
+    """
+    Get the shared embedding function.
+
+    The ONNX model is loaded on first use, so every VectorStoreService shares a
+    single copy instead of loading its own.
+    """
+    quantized = get_settings().embedding_quantized
+    if quantized:
+        try:
+            import onnx  # noqa: F401
+        except ImportError:
+            logger.warning("onnx not installed, using full-precision embeddings")
+            quantized = False
+    return MiniLMEmbeddingFunction(quantized=quantized)
+
+
+def _query_rows(results: dict) -> Iterator[tuple[str, dict, float | None]]:
+    """Iterate the first query's documents with their metadata and distance."""
+    documents = results["documents"][0] if results["documents"] else []
+    metadatas = results["metadatas"][0] if results["metadatas"] else None
+    distances = results["distances"][0] if results["distances"] else None
+    return zip(
+        documents,
+        metadatas or [{}] * len(documents),
+        distances or [None] * len(documents),
+        strict=True,
+    )
 
 
 class VectorStoreService:
     """Service for vector store operations using ChromaDB."""
 
+    # HNSW index parameters per collection. Resumes and job descriptions get a
+    # denser graph for recall as they grow; the company cache stays small.
+    COLLECTION_HNSW = {
+        "resumes": {"max_neighbors": 32, "ef_construction": 200, "ef_search": 64},
+        "job_descriptions": {
+            "max_neighbors": 32,
+            "ef_construction": 200,
+            "ef_search": 64,
+        },
+        "companies": {"max_neighbors": 16, "ef_construction": 100, "ef_search": 32},
+    }
+
     def __init__(self):
         self.settings = get_settings()
         self._client: chromadb.Client | None = None
         self._embedding_function = None
+        self._collections: dict[str, Collection] = {}
 
     @property
     def client(self) -> chromadb.Client:
@@ -41,23 +147,105 @@ class VectorStoreService:
         This is much lighter than sentence-transformers with PyTorch.
         """
         if self._embedding_function is None:
-            self._embedding_function = embedding_functions.DefaultEmbeddingFunction()
+            self._embedding_function = get_embedding_function()
         return self._embedding_function
 
-    def _get_or_create_collection(self, name: str):
+    def _hnsw_configuration(self, name: str) -> dict:
+        """Get the collection configuration for a collection name."""
+        return {"hnsw": {"space": "cosine", **self.COLLECTION_HNSW.get(name, {})}}
+
+    def _get_or_create_collection(self, name: str) -> Collection:
         """Get or create a ChromaDB collection with embedding function."""
-        return self.client.get_or_create_collection(
-            name=name,
+        # Collections are only dropped by migrate_collection_settings, which
+        # runs before requests are served, so a handle stays valid
+        if name not in self._collections:
+            self._collections[name] = self.client.get_or_create_collection(
+                name=name,
+                embedding_function=self.embedding_function,
+                configuration=self._hnsw_configuration(name),
+            )
+        return self._collections[name]
+
+    def migrate_collection_settings(self) -> list[str]:
+        """
+        Bring existing collections up to COLLECTION_HNSW.
+
+        ef_search is updated in place. The graph parameters are fixed when a
+        collection is created, so collections built with other values are
+        copied, stored embeddings included, into a new collection that
+        replaces the old one. Nothing is re-embedded. The copy is staged under
+        a temporary name, which lets an interrupted run resume on the next
+        start.
+
+        Returns:
+            Names of the collections that were changed.
+        """
+        existing = {collection.name for collection in self.client.list_collections()}
+        changed = []
+
+        for name, params in self.COLLECTION_HNSW.items():
+            staging = f"{name}_rebuild"
+            if staging in existing and name not in existing:
+                # The old collection was dropped but the rename never happened
+                self.client.get_collection(staging).modify(name=name)
+                existing.add(name)
+            elif staging in existing:
+                # The copy was interrupted; the original is still intact
+                self.client.delete_collection(staging)
+            if name not in existing:
+                continue
+
+            collection = self.client.get_collection(
+                name, embedding_function=self.embedding_function
+            )
+            current = (collection.configuration or {}).get("hnsw") or {}
+            graph_keys = ("max_neighbors", "ef_construction")
+            if any(current.get(key) != params[key] for key in graph_keys):
+                self._rebuild_collection(collection, staging)
+            elif current.get("ef_search") != params["ef_search"]:
+                collection.modify(
+                    configuration={"hnsw": {"ef_search": params["ef_search"]}}
+                )
+            else:
+                continue
+
+            self._collections.pop(name, None)
+            changed.append(name)
+
+        return changed
+
+    def _rebuild_collection(self, collection: Collection, staging: str) -> None:
+        """Copy a collection into one built with its configured HNSW settings."""
+        name = collection.name
+        records = collection.get(include=["documents", "metadatas", "embeddings"])
+        rebuilt = self.client.create_collection(
+            staging,
             embedding_function=self.embedding_function,
-            metadata={"hnsw:space": "cosine"},
+            configuration=self._hnsw_configuration(name),
         )
 
-    async def index_resume(self, resume: Resume) -> None:
+        batch_size = self.client.get_max_batch_size()
+        for start in range(0, len(records["ids"]), batch_size):
+            end = start + batch_size
+            rebuilt.add(
+                ids=records["ids"][start:end],
+                embeddings=records["embeddings"][start:end],
+                documents=records["documents"][start:end],
+                metadatas=records["metadatas"][start:end],
+            )
+
+        self.client.delete_collection(name)
+        rebuilt.modify(name=name)
+
+    async def index_resume(self, resume: Resume, store_full: bool = False) -> None:
         """
         Index a resume's content for semantic search.
 
         Args:
             resume: The resume to index.
+            store_full: Also index the whole resume text as one document. Off by
+                default: the sections already cover the same text, and the
+                embedding model only reads the first 256 tokens of a document.
         """
         collection = self._get_or_create_collection("resumes")
 
@@ -65,18 +253,19 @@ class VectorStoreService:
         metadatas = []
         ids = []
 
-        documents.append(resume.raw_text)
-        metadatas.append(
-            {
-                "resume_id": resume.id,
-                "user_id": resume.user_id,
-                "type": "full_resume",
-                "filename": resume.filename,
-            }
-        )
-        ids.append(f"{resume.id}_full")
+        if store_full:
+            documents.append(resume.raw_text)
+            metadatas.append(
+                {
+                    "resume_id": resume.id,
+                    "user_id": resume.user_id,
+                    "type": "full_resume",
+                    "filename": resume.filename,
+                }
+            )
+            ids.append(f"{resume.id}_full")
 
-        for section in resume.sections:
+        for i, section in enumerate(resume.sections):
             if section.content.strip():
                 documents.append(section.content)
                 metadatas.append(
@@ -88,18 +277,71 @@ class VectorStoreService:
                         "section_title": section.title,
                     }
                 )
-                ids.append(
-                    f"{resume.id}_{section.section_type.value}_{uuid4().hex[:8]}"
-                )
+                ids.append(f"{resume.id}_{section.section_type.value}_{i}")
 
         if documents:
-            # ChromaDB handles embeddings automatically via the collection's embedding_function
-            collection.add(
+            for document, metadata in zip(documents, metadatas, strict=True):
+                metadata["content_sha256"] = hashlib.sha256(
+                    document.encode()
+                ).hexdigest()
+            # Embedding is CPU-bound, so run it in a thread to keep the loop free
+            embeddings = await asyncio.to_thread(
+                self._embed_documents, collection, documents, metadatas
+            )
+            # Section ids are deterministic, so re-indexing replaces documents
+            await asyncio.to_thread(
+                collection.upsert,
                 documents=documents,
+                embeddings=embeddings,
                 metadatas=metadatas,
                 ids=ids,
             )
 
+        # Drop documents for sections the resume no longer has
+        indexed = await asyncio.to_thread(
+            collection.get, where={"resume_id": resume.id}, include=[]
+        )
+        stale = sorted(set(indexed["ids"]) - set(ids))
+        if stale:
+            await asyncio.to_thread(collection.delete, ids=stale)
+
+    def _embed_documents(
+        self, collection, documents: list[str], metadatas: list[dict]
+    ) -> list:
+        """
+        Embed documents, reusing stored vectors for content already indexed.
+
+        Args:
+            collection: Collection that may hold earlier copies of the content.
+            documents: Documents to embed.
+            metadatas: Matching metadata, each carrying a content_sha256.
+
+        Returns:
+            One embedding per document, in order.
+        """
+        hashes = [metadata["content_sha256"] for metadata in metadatas]
+        existing = collection.get(
+            where={"content_sha256": {"$in": list(set(hashes))}},
+            include=["embeddings", "metadatas"],
+        )
+        embeddings_by_hash = {
+            metadata["content_sha256"]: embedding
+            for metadata, embedding in zip(
+                existing["metadatas"], existing["embeddings"], strict=True
+            )
+        }
+
+        missing = {
+            content_hash: document
+            for content_hash, document in zip(hashes, documents, strict=True)
+            if content_hash not in embeddings_by_hash
+        }
+        if missing:
+            new_embeddings = self.embedding_function(list(missing.values()))
+            embeddings_by_hash.update(zip(missing, new_embeddings, strict=True))
+
+        return [embeddings_by_hash[content_hash] for content_hash in hashes]
+
     async def search_resume_content(
         self, query: str, resume_id: str | None = None, n_results: int = 5
     ) -> list[dict]:
@@ -120,30 +362,19 @@ class VectorStoreService:
         if resume_id:
             where_filter = {"resume_id": resume_id}
 
-        # ChromaDB handles embedding the query automatically
-        results = collection.query(
+        # ChromaDB embeds the query itself; both are blocking, so use a thread
+        results = await asyncio.to_thread(
+            collection.query,
             query_texts=[query],
             n_results=n_results,
             where=where_filter,
             include=["documents", "metadatas", "distances"],
         )
 
-        search_results = []
-        if results["documents"] and results["documents"][0]:
-            for i, doc in enumerate(results["documents"][0]):
-                search_results.append(
-                    {
-                        "content": doc,
-                        "metadata": results["metadatas"][0][i]
-                        if results["metadatas"]
-                        else {},
-                        "distance": results["distances"][0][i]
-                        if results["distances"]
-                        else None,
-                    }
-                )
-
-        return search_results
+        return [
+            {"content": doc, "metadata": metadata, "distance": distance}
+            for doc, metadata, distance in _query_rows(results)
+        ]
 
     async def index_job_description(
         self,
@@ -196,27 +427,17 @@ class VectorStoreService:
         """
         collection = self._get_or_create_collection("job_descriptions")
 
-        results = collection.query(
+        results = await asyncio.to_thread(
+            collection.query,
             query_texts=[resume_text],
             n_results=n_results,
             include=["documents", "metadatas", "distances"],
         )
 
-        job_results = []
-        if results["documents"] and results["documents"][0]:
-            for i, doc in enumerate(results["documents"][0]):
-                job_results.append(
-                    {
-                        "content": doc,
-                        "metadata": results["metadatas"][0][i]
-                        if results["metadatas"]
-                        else {},
-                        "similarity": 1
-                        - (results["distances"][0][i] if results["distances"] else 0),
-                    }
-                )
-
-        return job_results
+        return [
+            {"content": doc, "metadata": metadata, "similarity": 1 - (distance or 0)}
+            for doc, metadata, distance in _query_rows(results)
+        ]
 
     async def delete_resume_index(self, resume_id: str) -> None:
         """
@@ -280,25 +501,14 @@ class VectorStoreService:
         """
         collection = self._get_or_create_collection("companies")
 
-        results = collection.query(
+        results = await asyncio.to_thread(
+            collection.query,
             query_texts=[query],
             n_results=n_results,
             include=["documents", "metadatas", "distances"],
         )
 
-        company_results = []
-        if results["documents"] and results["documents"][0]:
-            for i, doc in enumerate(results["documents"][0]):
-                company_results.append(
-                    {
-                        "content": doc,
-                        "metadata": results["metadatas"][0][i]
-                        if results["metadatas"]
-                        else {},
-                        "distance": results["distances"][0][i]
-                        if results["distances"]
-                        else None,
-                    }
-                )
-
-        return company_results
+        return [
+            {"content": doc, "metadata": metadata, "distance": distance}
+            for doc, metadata, distance in _query_rows(results)
+        ]
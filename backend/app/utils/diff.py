@@ -0,0 +1,144 @@
+"""
+Line diff helpers.
+
+Myers' O(ND) shortest edit script over lists of lines. Runtime grows with the
+number of edits rather than the document size, which suits resume revisions
+that usually touch only a few lines.
+"""
+
+from collections.abc import Iterator, Sequence
+
+# Edit distance after which a diff gives up and reports a full replacement
+DEFAULT_MAX_EDITS = 2000
+
+
+def myers_diff(
+    a: Sequence[str], b: Sequence[str], max_edits: int = DEFAULT_MAX_EDITS
+) -> list[tuple[str, list[str]]]:
+    """
+    Compute a shortest edit script between two sequences of lines.
+
+    Args:
+        a: Original lines.
+        b: New lines.
+        max_edits: Maximum edit distance to search.
+
+    Returns:
+        The runs produced by iter_diff, as a list.
+    """
+    return list(iter_diff(a, b, max_edits))
+
+
+def iter_diff(
+    a: Sequence[str], b: Sequence[str], max_edits: int = DEFAULT_MAX_EDITS
+) -> Iterator[tuple[str, list[str]]]:
+    """
+    Lazily yield the runs of a shortest edit script between two sequences.
+
+    Runs are built as they are consumed, so callers that only want the first
+    few can stop early without grouping or copying the rest.
+
+    Args:
+        a: Original lines.
+        b: New lines.
+        max_edits: Maximum edit distance to search. Beyond it the sequences are
+            reported as entirely replaced, which bounds the worst case.
+
+    Returns:
+        Runs of (op, lines) in document order, where op is "equal", "delete"
+        or "insert". Deletions come before insertions within a change.
+    """
+    # Unchanged head and tail lines never need the edit search
+    prefix = 0
+    limit = min(len(a), len(b))
+    while prefix < limit and a[prefix] == b[prefix]:
+        prefix += 1
+    suffix = 0
+    limit -= prefix
+    while suffix < limit and a[-1 - suffix] == b[-1 - suffix]:
+        suffix += 1
+
+    if prefix:
+        yield ("equal", list(a[:prefix]))
+    yield from _diff_window(
+        a[prefix : len(a) - suffix], b[prefix : len(b) - suffix], max_edits
+    )
+    if suffix:
+        yield ("equal", list(a[len(a) - suffix :]))
+
+
+def _diff_window(
+    a: Sequence[str], b: Sequence[str], max_edits: int
+) -> Iterator[tuple[str, list[str]]]:
+    """Run the Myers search over sequences with no common head or tail."""
+    n, m = len(a), len(b)
+    v = {1: 0}
+    trace: list[dict[int, int]] = []
+
+    for d in range(min(n + m, max_edits) + 1):
+        trace.append(v.copy())
+        for k in range(-d, d + 1, 2):
+            if k == -d or (k != d and v[k - 1] < v[k + 1]):
+                x = v[k + 1]
+            else:
+                x = v[k - 1] + 1
+            y = x - k
+            while x < n and y < m and a[x] == b[y]:
+                x += 1
+                y += 1
+            v[k] = x
+            if x >= n and y >= m:
+                yield from _group_runs(_backtrack(trace, a, b))
+                return
+
+    if a:
+        yield ("delete", list(a))
+    if b:
+        yield ("insert", list(b))
+
+
+def _backtrack(
+    trace: list[dict[int, int]], a: Sequence[str], b: Sequence[str]
+) -> list[tuple[str, str]]:
+    """Walk the search trace back from the end to recover per-line edits."""
+    x, y = len(a), len(b)
+    edits: list[tuple[str, str]] = []
+
+    for d in range(len(trace) - 1, -1, -1):
+        v = trace[d]
+        k = x - y
+        if k == -d or (k != d and v[k - 1] < v[k + 1]):
+            prev_k = k + 1
+        else:
+            prev_k = k - 1
+        prev_x = v[prev_k]
+        prev_y = prev_x - prev_k
+
+        while x > prev_x and y > prev_y:
+            x -= 1
+            y -= 1
+            edits.append(("equal", a[x]))
+        if d > 0:
+            if x == prev_x:
+                edits.append(("insert", b[y - 1]))
+            else:
+                edits.append(("delete", a[x - 1]))
+        x, y = prev_x, prev_y
+
+    edits.reverse()
+    return edits
+
+
+def _group_runs(
+    edits: list[tuple[str, str]],
+) -> Iterator[tuple[str, list[str]]]:
+    """Merge consecutive edits with the same op into runs, one at a time."""
+    run_op, run_lines = None, []
+    for op, line in edits:
+        if op != run_op and run_lines:
+            yield (run_op, run_lines)
+            run_lines = []
+        run_op = op
+        run_lines.append(line)
+    if run_lines:
+        yield (run_op, run_lines)
@@ -0,0 +1,78 @@
+"""
+Streaming helpers.
+
+Coalesces small token deltas into larger chunks so streaming endpoints don't
+pay per-token HTTP framing overhead.
+"""
+
+import asyncio
+from collections.abc import AsyncIterator
+from typing import Any
+
+DEFAULT_MAX_BATCH = 8
+DEFAULT_MAX_WAIT_MS = 50
+
+
+class TokenBatcher:
+    """
+    Async iterator that batches string deltas from a source stream.
+
+    A batch is flushed once it holds `max_batch` tokens or its oldest token has
+    waited `max_wait_ms`, whichever comes first. Non-string items are passed
+    through unchanged after flushing any buffered tokens.
+    """
+
+    def __init__(
+        self,
+        source: AsyncIterator[Any],
+        max_batch: int = DEFAULT_MAX_BATCH,
+        max_wait_ms: int = DEFAULT_MAX_WAIT_MS,
+    ):
+        self.source = source
+        self.max_batch = max_batch
+        self.max_wait = max_wait_ms / 1000
+
+    async def __aiter__(self) -> AsyncIterator[Any]:
+        loop = asyncio.get_running_loop()
+        iterator = aiter(self.source)
+        buffer: list[str] = []
+        deadline = 0.0
+        pending: asyncio.Future | None = None
+
+        try:
+            while True:
+                if pending is None:
+                    pending = asyncio.ensure_future(anext(iterator))
+
+                timeout = max(0.0, deadline - loop.time()) if buffer else None
+                done, _ = await asyncio.wait({pending}, timeout=timeout)
+                if not done:
+                    yield "".join(buffer)
+                    buffer.clear()
+                    continue
+
+                future, pending = pending, None
+                try:
+                    item = future.result()
+                except StopAsyncIteration:
+                    break
+
+                if isinstance(item, str):
+                    if not buffer:
+                        deadline = loop.time() + self.max_wait
+                    buffer.append(item)
+                    if len(buffer) >= self.max_batch:
+                        yield "".join(buffer)
+                        buffer.clear()
+                    continue
+
+                if buffer:
+                    yield "".join(buffer)
+                    buffer.clear()
+                yield item
+
+            if buffer:
+                yield "".join(buffer)
+        finally:
+            if pending is not None:
+                pending.cancel()
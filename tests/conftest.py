@@ -7,6 +7,9 @@ import sys
 from pathlib import Path
 
 import pytest
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
 
 # Add project root to path for imports
 PROJECT_ROOT = Path(__file__).parent.parent
@@ -19,9 +22,15 @@ if sys.platform == "win32":
 
 # API base URL for integration tests
 API_BASE_URL = os.getenv("API_BASE_URL", "http://127.0.0.1:8000/api")
+UPLOAD_URL = f"{API_BASE_URL}/resume/upload"
+CHAT_URL = f"{API_BASE_URL}/chat/message"
+EXPORT_URL_TMPL = f"{API_BASE_URL}/resume/{{resume_id}}/export"
 
+# Where integration tests save downloaded artifacts
+OUTPUT_DIR = PROJECT_ROOT / "output"
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
 def api_url():
     """Return the API base URL."""
     return API_BASE_URL
@@ -40,3 +49,87 @@ def sample_resume_path(project_root):
     if resume_path.exists():
         return resume_path
     return None
+
+
+def find_resume_path() -> Path | None:
+    """Return the sample resume, or any non-assignment PDF in the project root."""
+    resume_path = PROJECT_ROOT / "Resume_Mrinal_Bhan.pdf"
+    if resume_path.exists():
+        return resume_path
+    for pdf in PROJECT_ROOT.glob("*.pdf"):
+        if "assignment" not in pdf.name.lower():
+            return pdf
+    return None
+
+
+@pytest.fixture(scope="session")
+def resume_path():
+    """Return the resume used by the integration tests, skipping if missing."""
+    path = find_resume_path()
+    if not path:
+        pytest.skip("No resume file found")
+    return path
+
+
+@pytest.fixture(scope="session")
+def output_dir():
+    """Create the artifact output directory once and return its path."""
+    OUTPUT_DIR.mkdir(exist_ok=True)
+    return OUTPUT_DIR
+
+
+@pytest.fixture(scope="session")
+def http_session():
+    """Return a pooled HTTP session shared by the integration tests."""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=1,
+        pool_maxsize=20,
+        max_retries=Retry(
+            total=3, backoff_factor=0.2, status_forcelist=[502, 503, 504]
+        ),
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    yield session
+    session.close()
+
+
+@pytest.fixture(scope="session")
+def resume_id(http_session, resume_path):
+    """Upload the test resume once per session and return its ID."""
+    with open(resume_path, "rb") as f:
+        response = http_session.post(
+            UPLOAD_URL,
+            files={"file": (resume_path.name, f, "application/pdf")},
+        )
+    resume_id = response.json().get("resume_id")
+    if not resume_id:
+        pytest.fail(f"Failed to upload resume: {response.text[:500]}")
+    print(f"Resume ID: {resume_id}")
+    return resume_id
+
+
+class FakeResponse:
+    """Chat model response stub exposing only .content."""
+
+    def __init__(self, content: str):
+        self.content = content
+
+
+class CountingLLM:
+    """Chat model stub that returns fixed content and counts invocations."""
+
+    def __init__(self, content: str):
+        self.content = content
+        self.calls = 0
+
+    async def ainvoke(self, prompt):
+        self.calls += 1
+        return FakeResponse(self.content)
+
+
+@pytest.fixture
+def counting_llm():
+    """Return a factory for LLM stubs: counting_llm(content) -> CountingLLM."""
+    return CountingLLM
@@ -0,0 +1,104 @@
+"""Tests for the storage cache service."""
+
+from app.models.conversation import Message, MessageRole
+from app.services.cache_service import CachedStorage
+from app.services.firebase_service import InMemoryStore
+
+
+class _FakeRedis:
+    """Dict-backed stand-in for the async Redis client."""
+
+    def __init__(self):
+        self.data: dict[str, bytes] = {}
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def set(self, key, value, ex=None):
+        self.data[key] = value.encode() if isinstance(value, str) else value
+
+    async def delete(self, key):
+        self.data.pop(key, None)
+
+
+class _CountingStore(InMemoryStore):
+    """In-memory store that counts version list reads."""
+
+    def __init__(self):
+        super().__init__()
+        self.version_reads = 0
+
+    async def get_resume_versions(self, resume_id: str):
+        self.version_reads += 1
+        return await super().get_resume_versions(resume_id)
+
+
+class TestCachedStorage:
+    """Tests for the caching storage proxy."""
+
+    async def test_resume_versions_are_cached_until_a_new_version(self):
+        """Test that version lists are reused and refreshed after a write."""
+        store = _CountingStore()
+        storage = CachedStorage(store)
+
+        await storage.get_resume_versions("resume-1")
+        await storage.get_resume_versions("resume-1")
+        assert store.version_reads == 1
+
+        await storage.create_resume_version(
+            resume_id="resume-1",
+            content="v1",
+            sections=[],
+            changes_description="Initial",
+        )
+        versions = await storage.get_resume_versions("resume-1")
+
+        assert [v.version_number for v in versions] == [1]
+        assert store.version_reads == 2
+
+    async def test_version_by_number_uses_cached_list(self):
+        """Test that single-version lookups are served from a cached list."""
+        store = _CountingStore()
+        storage = CachedStorage(store)
+        for content in ("v1", "v2"):
+            await storage.create_resume_version(
+                resume_id="resume-1",
+                content=content,
+                sections=[],
+                changes_description=content,
+            )
+
+        assert (
+            await storage.get_resume_version_by_number("resume-1", 2)
+        ).content == "v2"
+        await storage.get_resume_versions("resume-1")
+        version = await storage.get_resume_version_by_number("resume-1", 1)
+
+        assert version.content == "v1"
+        assert await storage.get_resume_version_by_number("resume-1", 3) is None
+        assert store.version_reads == 1
+
+    async def test_cached_conversations_are_copies(self):
+        """Test that mutating a returned conversation does not touch the cache."""
+        storage = CachedStorage(InMemoryStore())
+        conversation = await storage.create_conversation(user_id="u")
+
+        loaded = await storage.get_conversation(conversation.id)
+        loaded.add_message(Message(id="m1", role=MessageRole.USER, content="Hi"))
+
+        assert (await storage.get_conversation(conversation.id)).messages == []
+
+    async def test_redis_copy_wins_over_another_workers_local_state(self):
+        """Test that a worker reads the conversation another worker last saved."""
+        store, redis = InMemoryStore(), _FakeRedis()
+        worker_a = CachedStorage(store, redis)
+        worker_b = CachedStorage(store, redis)
+        conversation = await worker_a.create_conversation(user_id="u")
+        await worker_a.get_conversation(conversation.id)
+
+        updated = await worker_b.get_conversation(conversation.id)
+        updated.add_message(Message(id="m1", role=MessageRole.USER, content="Hi"))
+        await worker_b.update_conversation(updated)
+
+        loaded = await worker_a.get_conversation(conversation.id)
+        assert [m.content for m in loaded.messages] == ["Hi"]
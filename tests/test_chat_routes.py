@@ -0,0 +1,59 @@
+"""Tests for chat and resume route helpers (no LLM calls)."""
+
+from app.api.routes import chat, resume
+from app.models.chat import ChatRequest
+from app.models.resume import Resume, ResumeSection, SectionType
+from app.services.cache_service import CachedStorage
+from app.services.firebase_service import InMemoryStore
+
+
+async def test_turn_after_revert_uses_the_reverted_resume(monkeypatch):
+    """Test that a chat turn sees a revert made outside the conversation."""
+    storage = CachedStorage(InMemoryStore())
+    monkeypatch.setattr(chat, "get_storage_service", lambda: storage)
+    monkeypatch.setattr(resume, "get_storage_service", lambda: storage)
+
+    original = [
+        ResumeSection(section_type=SectionType.SKILLS, title="Skills", content="Go")
+    ]
+    await storage.save_resume(
+        Resume(id="r1", user_id="u", filename="cv.pdf", raw_text="cv")
+    )
+    await storage.create_resume_version(
+        resume_id="r1", content="Go", sections=original, changes_description="v1"
+    )
+    conversation, loaded, _ = await chat._prepare_turn(
+        ChatRequest(message="hi", resume_id="r1")
+    )
+    loaded.sections = [original[0].model_copy(update={"content": "Python"})]
+    await storage.update_resume(loaded)
+    await storage.update_conversation(conversation)
+
+    await resume.revert_to_version("r1", 1)
+    _, loaded, _ = await chat._prepare_turn(
+        ChatRequest(message="again", conversation_id=conversation.id)
+    )
+
+    assert [s.content for s in loaded.sections] == ["Go"]
+
+
+async def test_background_indexing_keeps_edits_made_meanwhile(monkeypatch):
+    """Test that recording the indexing status does not undo a concurrent edit."""
+    storage = CachedStorage(InMemoryStore())
+    monkeypatch.setattr(resume, "get_storage_service", lambda: storage)
+
+    uploaded = Resume(id="r1", user_id="u", filename="cv.pdf", raw_text="cv")
+    await storage.save_resume(uploaded)
+    edited = await storage.get_resume("r1")
+    edited.raw_text = "edited cv"
+    await storage.update_resume(edited)
+
+    class _VectorStore:
+        async def index_resume(self, resume):
+            pass
+
+    await resume._index_resume(_VectorStore(), uploaded)
+
+    stored = await storage.get_resume("r1")
+    assert stored.raw_text == "edited cv"
+    assert stored.metadata["indexing_status"] == "indexed"
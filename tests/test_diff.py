@@ -0,0 +1,54 @@
+"""Tests for line diff helpers."""
+
+from app.utils.diff import iter_diff, myers_diff
+
+
+def test_single_line_edit():
+    """Test that a changed line is reported as one removal and one addition."""
+    a = ["Summary\n", "Led a team of 3\n", "Python\n"]
+    b = ["Summary\n", "Led a team of 5\n", "Python\n"]
+
+    assert myers_diff(a, b) == [
+        ("equal", ["Summary\n"]),
+        ("delete", ["Led a team of 3\n"]),
+        ("insert", ["Led a team of 5\n"]),
+        ("equal", ["Python\n"]),
+    ]
+
+
+def test_identical_and_empty_inputs():
+    """Test the degenerate cases."""
+    assert myers_diff(["a\n"], ["a\n"]) == [("equal", ["a\n"])]
+    assert myers_diff([], ["a\n"]) == [("insert", ["a\n"])]
+    assert myers_diff(["a\n"], []) == [("delete", ["a\n"])]
+    assert myers_diff([], []) == []
+
+
+def test_edit_limit_falls_back_to_replacement():
+    """Test that exceeding max_edits reports a full replacement."""
+    assert myers_diff(["a", "b"], ["c", "d"], max_edits=1) == [
+        ("delete", ["a", "b"]),
+        ("insert", ["c", "d"]),
+    ]
+
+
+def test_common_prefix_and_suffix_are_kept():
+    """Test that trimmed head and tail lines come back as equal runs."""
+    a = [f"line {i}\n" for i in range(100)]
+    b = a[:50] + ["inserted\n"] + a[50:]
+
+    assert myers_diff(a, b) == [
+        ("equal", a[:50]),
+        ("insert", ["inserted\n"]),
+        ("equal", a[50:]),
+    ]
+
+
+def test_iter_diff_stops_at_the_runs_consumed():
+    """Test that runs are produced lazily in document order."""
+    a = [f"line {i}\n" for i in range(10)]
+    b = ["first\n"] + a[1:9] + ["last\n"]
+    runs = iter_diff(a, b)
+
+    assert next(runs) == ("delete", ["line 0\n"])
+    assert next(runs) == ("insert", ["first\n"])
@@ -3,56 +3,30 @@
 import sys
 from pathlib import Path
 
-import requests
+import pytest
 
-# Force UTF-8 output for Windows
-if sys.platform == "win32":
-    sys.stdout.reconfigure(encoding="utf-8", errors="replace")
+from tests.conftest import CHAT_URL, EXPORT_URL_TMPL
 
-BASE_URL = "http://127.0.0.1:8000/api"
-PROJECT_ROOT = Path(__file__).parent.parent
-OUTPUT_DIR = PROJECT_ROOT / "output"
+# Export downloads are written to disk in chunks of this size
+DOWNLOAD_CHUNK_SIZE = 1 << 20
 
 
-def get_resume_path():
-    """Get path to test resume."""
-    resume_path = PROJECT_ROOT / "Resume_Mrinal_Bhan.pdf"
-    if resume_path.exists():
-        return resume_path
-    for pdf in PROJECT_ROOT.glob("*.pdf"):
-        if "assignment" not in pdf.name.lower():
-            return pdf
-    return None
+def save_download(response, output_path: Path) -> int:
+    """Stream a response body to a file and return the number of bytes written."""
+    with open(output_path, "wb") as f:
+        for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+            f.write(chunk)
+    return output_path.stat().st_size
 
 
-def test_export():
+def test_export(resume_id, http_session, output_dir):
     """Test resume export in different formats."""
-    resume_path = get_resume_path()
-    if not resume_path:
-        print("No resume file found. Skipping test.")
-        return
-
-    OUTPUT_DIR.mkdir(exist_ok=True)
-
-    # Upload resume
-    print("=== UPLOADING RESUME ===")
-    with open(resume_path, "rb") as f:
-        response = requests.post(
-            f"{BASE_URL}/resume/upload",
-            files={"file": (resume_path.name, f, "application/pdf")},
-        )
-        data = response.json()
-        print(f"Resume ID: {data.get('resume_id')}")
-        resume_id = data.get("resume_id")
-
-    if not resume_id:
-        print("Failed to upload resume!")
-        return
+    export_url = EXPORT_URL_TMPL.format(resume_id=resume_id)
 
     # Optimize resume first
     print("\n=== OPTIMIZING RESUME ===")
-    response = requests.post(
-        f"{BASE_URL}/chat/message",
+    response = http_session.post(
+        CHAT_URL,
         json={
             "message": "Optimize my resume for Google",
             "resume_id": resume_id,
@@ -65,45 +39,48 @@ def test_export():
 
     # Export as PDF
     print("\n=== EXPORTING PDF ===")
-    response = requests.post(
-        f"{BASE_URL}/resume/{resume_id}/export?format=pdf",
+    with http_session.post(
+        export_url,
+        params={"format": "pdf"},
         timeout=30,
-    )
-    print(f"Status: {response.status_code}")
-    print(f"Content-Type: {response.headers.get('content-type')}")
-
-    if response.status_code == 200 and "application/pdf" in response.headers.get(
-        "content-type", ""
-    ):
-        output_path = OUTPUT_DIR / "test_optimized.pdf"
-        with open(output_path, "wb") as f:
-            f.write(response.content)
-        print(f"PDF saved to: {output_path}")
-        print(f"File size: {len(response.content)} bytes")
-    else:
-        print(f"Export failed: {response.text[:500]}")
+        stream=True,
+    ) as response:
+        print(f"Status: {response.status_code}")
+        print(f"Content-Type: {response.headers.get('content-type')}")
+
+        if response.status_code == 200 and "application/pdf" in response.headers.get(
+            "content-type", ""
+        ):
+            output_path = output_dir / "test_optimized.pdf"
+            size = save_download(response, output_path)
+            print(f"PDF saved to: {output_path}")
+            print(f"File size: {size} bytes")
+        else:
+            print(f"Export failed: {response.text[:500]}")
 
     # Export as DOCX
     print("\n=== EXPORTING DOCX ===")
-    response = requests.post(
-        f"{BASE_URL}/resume/{resume_id}/export?format=docx",
+    with http_session.post(
+        export_url,
+        params={"format": "docx"},
         timeout=30,
-    )
-    print(f"Status: {response.status_code}")
-
-    if response.status_code == 200 and "vnd.openxmlformats" in response.headers.get(
-        "content-type", ""
-    ):
-        output_path = OUTPUT_DIR / "test_optimized.docx"
-        with open(output_path, "wb") as f:
-            f.write(response.content)
-        print(f"DOCX saved to: {output_path}")
-        print(f"File size: {len(response.content)} bytes")
-    else:
-        print(f"Export failed: {response.text[:500]}")
+        stream=True,
+    ) as response:
+        print(f"Status: {response.status_code}")
+
+        if (
+            response.status_code == 200
+            and "vnd.openxmlformats" in response.headers.get("content-type", "")
+        ):
+            output_path = output_dir / "test_optimized.docx"
+            size = save_download(response, output_path)
+            print(f"DOCX saved to: {output_path}")
+            print(f"File size: {size} bytes")
+        else:
+            print(f"Export failed: {response.text[:500]}")
 
     print("\n=== EXPORT TESTS COMPLETE ===")
 
 
 if __name__ == "__main__":
-    test_export()
+    sys.exit(pytest.main([__file__, "-s"]))
@@ -0,0 +1,60 @@
+"""Tests for LLM helpers."""
+
+from app.core import llm as llm_module
+from app.core.config import Settings
+from app.core.llm import LLMFactory, get_http_client, get_llm
+
+
+def test_llms_share_http_client():
+    """Test that every LLM instance reuses the process-wide HTTP client."""
+    factory = LLMFactory(Settings(groq_api_key="test-key"))
+
+    first = factory.create_llm(temperature=0.7)
+    second = factory.create_llm(temperature=0.0, max_tokens=120)
+
+    assert first.http_async_client is get_http_client()
+    assert second.http_async_client is first.http_async_client
+
+
+def test_get_llm_caches_per_configuration(monkeypatch):
+    """Test that get_llm reuses instances for identical configurations."""
+
+    class _StubFactory:
+        def create_llm(self, temperature, max_tokens, **model_kwargs):
+            return object()
+
+    monkeypatch.setattr(llm_module, "LLMFactory", _StubFactory)
+    llm_module._get_cached_llm.cache_clear()
+
+    json_mode = {"response_format": {"type": "json_object"}}
+    assert get_llm(0.0, 120, **json_mode) is get_llm(0.0, 120, **json_mode)
+    assert get_llm(0.0, 120) is not get_llm(0.0, 120, **json_mode)
+    assert get_llm(0.7) is not get_llm(0.0)
+
+    llm_module._get_cached_llm.cache_clear()
+
+
+async def test_llms_refetched_after_http_client_closed(monkeypatch):
+    """Test that agents and the router drop LLMs bound to a closed HTTP client."""
+    from app.agents.router import ConversationRouter
+    from app.agents.translation import TranslationAgent
+
+    settings = Settings(groq_api_key="test-key")
+    monkeypatch.setattr(llm_module, "LLMFactory", lambda: LLMFactory(settings))
+    llm_module._get_cached_llm.cache_clear()
+
+    agent = TranslationAgent()
+    router = ConversationRouter()
+    stale = (agent.llm, router.llm, router.routing_llm)
+
+    await llm_module.close_http_client()
+    fresh = (agent.llm, router.llm, router.routing_llm)
+
+    for old, new in zip(stale, fresh, strict=True):
+        assert old.http_async_client.is_closed
+        assert new is not old
+        assert new.http_async_client is get_http_client()
+        assert not new.http_async_client.is_closed
+
+    await llm_module.close_http_client()
+    llm_module._get_cached_llm.cache_clear()
@@ -0,0 +1,20 @@
+"""Tests for application-level middleware."""
+
+from app.main import create_app
+from fastapi.testclient import TestClient
+
+
+def test_oversize_upload_is_rejected_before_the_handler():
+    """Test that a declared Content-Length over the limit returns 413."""
+    app = create_app()
+    client = TestClient(app)
+
+    response = client.post(
+        "/api/resume/upload",
+        content=b"x",
+        headers={"Content-Length": str(1024**3), "Content-Type": "text/plain"},
+    )
+
+    assert response.status_code == 413
+    assert "File too large" in response.json()["detail"]
+    assert client.get("/api/health").status_code == 200
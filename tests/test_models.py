@@ -158,3 +158,60 @@ class TestConversationModels:
         assert AgentType.COMPANY_RESEARCH.value == "company_research"
         assert AgentType.JOB_MATCHING.value == "job_matching"
         assert AgentType.TRANSLATION.value == "translation"
+
+    def test_conversation_serialized_history_cache(self):
+        """Test that the serialized history is rebuilt only when messages change."""
+        conversation = Conversation(id="conv-123", user_id="user-456")
+        conversation.add_message(
+            Message(id="msg-1", role=MessageRole.USER, content="Hello")
+        )
+
+        first = conversation.get_serialized_history()
+        assert first[0]["content"] == "Hello"
+        assert conversation.get_serialized_history() is first
+
+        conversation.add_message(
+            Message(id="msg-2", role=MessageRole.ASSISTANT, content="Hi")
+        )
+        assert len(conversation.get_serialized_history()) == 2
+
+        conversation.clear_messages()
+        assert conversation.get_serialized_history() == []
+
+    def test_serialized_history_rebuilt_after_clear_and_refill(self):
+        """Test that clearing and re-adding as many messages is not served stale."""
+        conversation = Conversation(id="conv-123", user_id="user-456")
+        for content in ("old 1", "old 2"):
+            conversation.add_message(
+                Message(id=content, role=MessageRole.USER, content=content)
+            )
+        conversation.get_serialized_history()
+        conversation.history_preview()
+
+        conversation.clear_messages()
+        for content in ("new 1", "new 2"):
+            conversation.add_message(
+                Message(id=content, role=MessageRole.USER, content=content)
+            )
+
+        history = conversation.get_serialized_history()
+        assert [m["content"] for m in history] == ["new 1", "new 2"]
+        assert "old" not in conversation.history_preview()
+
+    def test_conversation_history_preview(self):
+        """Test that the routing preview tracks the most recent messages."""
+        conversation = Conversation(id="conv-123", user_id="user-456")
+        assert conversation.history_preview() == ""
+
+        for i in range(4):
+            conversation.add_message(
+                Message(id=f"msg-{i}", role=MessageRole.USER, content=f"m{i}")
+            )
+
+        preview = conversation.history_preview(limit=3)
+        assert preview.startswith("Recent conversation:\n")
+        assert "m0" not in preview
+        assert "- user: m3..." in preview
+
+        conversation.messages = []
+        assert conversation.history_preview(limit=3) == ""
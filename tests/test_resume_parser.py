@@ -0,0 +1,114 @@
+"""Tests for resume text extraction (no LLM calls)."""
+
+import io
+import tempfile
+import zipfile
+
+import pypdfium2 as pdfium
+from app.models.resume import SectionType
+from app.services import resume_parser
+from app.services.resume_parser import ResumeParserService
+from reportlab.pdfgen import canvas
+
+
+def _pdf(*pages: list[str]) -> io.BytesIO:
+    buffer = io.BytesIO()
+    pdf = canvas.Canvas(buffer)
+    for lines in pages:
+        for i, line in enumerate(lines):
+            pdf.drawString(50, 800 - 20 * i, line)
+        pdf.showPage()
+    pdf.save()
+    buffer.seek(0)
+    return buffer
+
+
+def test_extract_pdf_text_joins_pages():
+    """Test that page text keeps plain newlines and pages are blank-line separated."""
+    parser = ResumeParserService()
+    text = parser.extract_text(_pdf(["SKILLS", "Python, Go"], ["EDUCATION"]), "pdf")
+
+    assert text == "SKILLS\nPython, Go\n\nEDUCATION"
+
+
+def test_extract_pdf_text_falls_back_when_pdfium_fails(monkeypatch):
+    """Test that pdfplumber is used when pdfium rejects the file."""
+    parser = ResumeParserService()
+
+    def reject(file_bytes):
+        raise pdfium.PdfiumError("bad file")
+
+    monkeypatch.setattr(parser, "_extract_pdf_text", reject)
+    text = parser.extract_text(_pdf(["SKILLS", "Python"]), "pdf")
+
+    assert text == "SKILLS\nPython"
+
+
+def test_extract_pdf_text_from_rolled_over_upload():
+    """Test that a disk-backed spooled upload is parsed from the stream."""
+    parser = ResumeParserService()
+    upload = tempfile.SpooledTemporaryFile(max_size=16)
+    upload.write(_pdf(["SKILLS", "Python"]).getvalue())
+    upload.seek(0)
+
+    assert parser._is_disk_backed(upload)
+    assert parser.extract_text(upload, "pdf") == "SKILLS\nPython"
+    assert not parser._is_disk_backed(io.BytesIO())
+
+
+def test_fallback_extraction_keeps_pattern_priority():
+    """Test that earlier section patterns win when several match a line."""
+    parser = ResumeParserService()
+    sections = parser._fallback_section_extraction(
+        "Professional Summary\nBuilds APIs\nWork Experience\nAcme"
+    )
+
+    assert [s.section_type for s in sections] == [
+        SectionType.SUMMARY,
+        SectionType.EXPERIENCE,
+    ]
+
+
+def _docx(body_xml: str) -> io.BytesIO:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as archive:
+        archive.writestr(
+            "word/document.xml",
+            '<w:document xmlns:w="http://schemas.openxmlformats.org/'
+            f'wordprocessingml/2006/main"><w:body>{body_xml}</w:body></w:document>',
+        )
+    buffer.seek(0)
+    return buffer
+
+
+def test_extract_docx_text_reads_paragraphs_then_tables():
+    """Test that body paragraphs come first and table rows are pipe-joined."""
+    parser = ResumeParserService()
+    document = _docx(
+        "<w:p><w:r><w:t>Jane</w:t></w:r><w:r><w:tab/><w:t>Doe</w:t></w:r></w:p>"
+        "<w:p><w:r><w:t> </w:t></w:r></w:p>"
+        "<w:tbl><w:tr>"
+        "<w:tc><w:p><w:r><w:t>Python</w:t></w:r></w:p></w:tc>"
+        "<w:tc><w:p/></w:tc>"
+        "<w:tc><w:p><w:r><w:t>Go</w:t></w:r></w:p></w:tc>"
+        "</w:tr></w:tbl>"
+        "<w:p><w:r><w:t>Skills</w:t></w:r></w:p>"
+    )
+
+    assert parser.extract_text(document, "docx") == "Jane\tDoe\nSkills\nPython | Go"
+
+
+async def test_extract_sections_caches_by_resume_text(monkeypatch, counting_llm):
+    """Test that the same resume text is sent to the LLM only once."""
+    llm = counting_llm("SECTION_TYPE: skills\nTITLE: Skills\nCONTENT:\nPython\n---")
+    monkeypatch.setattr(resume_parser, "get_llm", lambda **kwargs: llm)
+    monkeypatch.setattr(ResumeParserService, "_section_cache", {})
+    parser = ResumeParserService()
+
+    first = await parser._extract_sections("Skills\nPython")
+    first[0].content = "edited"
+    second = await parser._extract_sections("Skills\nPython")
+
+    assert llm.calls == 1
+    assert second[0].section_type == SectionType.SKILLS
+    assert second[0].content == "Python"
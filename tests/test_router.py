@@ -0,0 +1,243 @@
+"""Unit tests for the conversation router (no LLM calls)."""
+
+from app.agents import router as router_module
+from app.agents.fast_router import fast_classify
+from app.agents.router import ConversationRouter, find_json
+from app.models.conversation import AgentType, Conversation
+
+
+class TestFastClassify:
+    """Tests for keyword fast-path classification."""
+
+    def test_job_description_marker(self):
+        """Test that an explicit JD marker routes to job matching."""
+        message = "Match me. Job description: " + "Python, FastAPI, LLMs. " * 10
+
+        agent_type, params = fast_classify(message)
+        assert agent_type == AgentType.JOB_MATCHING
+        assert params["has_job_description"] is True
+
+    def test_translate_request(self):
+        """Test that a translation request extracts the target language."""
+        agent_type, params = fast_classify("Translate my resume to Spanish")
+
+        assert agent_type == AgentType.TRANSLATION
+        assert params["target_language"] == "spanish"
+
+    def test_company_request(self):
+        """Test that a company optimization request extracts the company."""
+        agent_type, params = fast_classify("Optimize my resume for Google.")
+
+        assert agent_type == AgentType.COMPANY_RESEARCH
+        assert params["target_company"] == "Google"
+
+    def test_multi_word_company_is_kept_whole(self):
+        """Test that a company name spanning several words is not truncated."""
+        _, params = fast_classify("Tailor my resume for Goldman Sachs")
+
+        assert params["target_company"] == "Goldman Sachs"
+
+    def test_job_description_beats_company(self):
+        """Test that a pasted JD takes precedence over a company name."""
+        message = "Tailor my resume for Stripe.\n\nRequirements:\n- 3+ years Python"
+
+        assert fast_classify(message)[0] == AgentType.JOB_MATCHING
+
+    def test_ambiguous_message_falls_through(self):
+        """Test that ambiguous messages defer to the LLM classifier."""
+        assert fast_classify("translate for German companies") is None
+        assert fast_classify("optimize my resume for a startup") is None
+        assert fast_classify("tailor my resume for Japanese market") is None
+        assert fast_classify("Translate to German. Requirements: Python") is None
+        assert fast_classify("What can you do?") is None
+
+    def test_non_company_targets_fall_through(self):
+        """Test that capitalized words that are not companies are not routed."""
+        assert fast_classify("Optimize my resume to ATS standards") is None
+        assert fast_classify("Tailor my resume to Senior Data Scientist roles") is None
+        assert fast_classify("Optimize my resume for SEO roles") is None
+        assert fast_classify("optimize my resume for I guess Google") is None
+        assert fast_classify("Optimize my resume for ATS") is None
+        assert (
+            fast_classify(
+                "Optimize my resume for Google. I want to apply for an ML Engineer role."
+            )
+            is None
+        )
+
+    def test_inline_jd_keyword_is_not_a_job_description(self):
+        """Test that a JD heading word mid-sentence does not force job matching."""
+        assert fast_classify("Optimize it. Responsibilities: none") is None
+
+
+class TestParseRoutingResponse:
+    """Tests for routing response parsing."""
+
+    def test_find_json_handles_nesting_and_strings(self):
+        """Test that nested objects and braces in strings are kept whole."""
+        text = 'Sure! {"a": {"b": "}{"}, "c": 1} trailing {"d": 2}'
+
+        assert find_json(text) == '{"a": {"b": "}{"}, "c": 1}'
+        assert find_json("no json here {") is None
+
+    def test_find_json_skips_braces_quoted_in_prose(self):
+        """Test that a brace quoted before the real object does not hide it."""
+        text = 'I\'ll "use {x}" here: {"agent": "TRANSLATION"}'
+
+        assert find_json(text) == '{"agent": "TRANSLATION"}'
+        assert find_json('"a { b" then {"c": 1}') == '{"c": 1}'
+
+    def test_json_wrapped_in_prose(self):
+        """Test that nested extracted_params survive prose around the JSON."""
+        router = ConversationRouter()
+        agent_type, params = router._parse_routing_response(
+            'Here you go:\n```json\n{"agent": "TRANSLATION", "confidence": 0.8, '
+            '"reasoning": "x", "extracted_params": {"target_language": "french"}}\n```'
+        )
+
+        assert agent_type == AgentType.TRANSLATION
+        assert params["target_language"] == "french"
+        assert params["confidence"] == 0.8
+
+
+class TestRoutingCache:
+    """Tests for caching of LLM routing decisions."""
+
+    async def test_repeated_message_skips_llm(self, counting_llm):
+        """Test that an identical message is classified only once."""
+        router = ConversationRouter()
+        router._routing_llm = counting_llm(
+            '{"agent": "TRANSLATION", "confidence": 0.9, "reasoning": "x", '
+            '"extracted_params": {"target_language": "german"}}'
+        )
+        conversation = Conversation(id="conv-123", user_id="user-456")
+
+        first = await router._classify_intent("I need this in German", conversation, {})
+        second = await router._classify_intent(
+            "I need this in German", conversation, {}
+        )
+
+        assert first == second
+        assert first[0] == AgentType.TRANSLATION
+        assert router._routing_llm.calls == 1
+
+    async def test_parse_errors_are_not_cached(self, counting_llm):
+        """Test that unparseable routing responses are retried."""
+        router = ConversationRouter()
+        router._routing_llm = counting_llm("not json")
+        conversation = Conversation(id="conv-123", user_id="user-456")
+
+        await router._classify_intent("hello there", conversation, {})
+        await router._classify_intent("hello there", conversation, {})
+
+        assert router._routing_llm.calls == 2
+
+    async def test_corrupt_redis_entry_is_a_miss(self, monkeypatch, counting_llm):
+        """Test that a bad Redis payload is deleted and the LLM is asked."""
+        redis = _CorruptRedis()
+        monkeypatch.setattr(router_module, "get_redis_client", lambda: redis)
+        router = ConversationRouter()
+        router._routing_llm = counting_llm(
+            '{"agent": "TRANSLATION", "confidence": 0.9, "reasoning": "x", '
+            '"extracted_params": {"target_language": "german"}}'
+        )
+        conversation = Conversation(id="conv-123", user_id="user-456")
+
+        agent_type, _ = await router._classify_intent(
+            "I need this in German", conversation, {}
+        )
+
+        assert agent_type == AgentType.TRANSLATION
+        assert router._routing_llm.calls == 1
+        assert len(redis.deleted) == 1
+
+
+class _CorruptRedis:
+    """Redis stub holding one unparseable routing entry."""
+
+    def __init__(self):
+        self.data = {}
+        self.deleted = []
+
+    async def get(self, key):
+        return self.data.get(key, b"{not json")
+
+    async def set(self, key, value, ex=None):
+        self.data[key] = value
+
+    async def delete(self, key):
+        self.deleted.append(key)
+
+
+class _PreparingAgent:
+    """Agent stub that records speculative prepare calls."""
+
+    def __init__(self, agent_type: AgentType):
+        self.agent_type = agent_type
+        self.prepared = False
+
+    async def prepare(self, user_message, context):
+        self.prepared = True
+        return {"prepared_by": self.agent_type.value}
+
+
+class TestSpeculativePrepare:
+    """Tests for speculative agent preparation during classification."""
+
+    async def test_chosen_agent_prepare_is_merged(self, counting_llm):
+        """Test that the chosen agent's prepared context reaches its params."""
+        router = ConversationRouter()
+        router._routing_llm = counting_llm(
+            '{"agent": "COMPANY_RESEARCH", "confidence": 0.9, "reasoning": "x", '
+            '"extracted_params": {"company_name": "Acme"}}'
+        )
+        agents = {t: _PreparingAgent(t) for t in router.SPECULATIVE_AGENTS}
+        router._get_agent = agents.get
+
+        async def general_query(*args):
+            return None
+
+        router._handle_general_query = general_query
+        conversation = Conversation(id="conv-123", user_id="user-456")
+
+        agent_type, params, _ = await router._classify_with_speculation(
+            "I would like help with my resume. " * 10, None, conversation, {}
+        )
+
+        assert agent_type == AgentType.COMPANY_RESEARCH
+        assert params["prepared_by"] == AgentType.COMPANY_RESEARCH.value
+        assert params["company_name"] == "Acme"
+
+    async def test_cached_route_skips_speculation(self, counting_llm):
+        """Test that a routing cache hit starts no general answer or prepare."""
+        router = ConversationRouter()
+        router._routing_llm = counting_llm(
+            '{"agent": "COMPANY_RESEARCH", "confidence": 0.9, "reasoning": "x", '
+            '"extracted_params": {"company_name": "Acme"}}'
+        )
+        conversation = Conversation(id="conv-123", user_id="user-456")
+        message = "I would like help with my resume. " * 10
+        await router._classify_intent(message, conversation, {})
+
+        agents = {t: _PreparingAgent(t) for t in router.SPECULATIVE_AGENTS}
+        router._get_agent = agents.get
+        general_calls = []
+
+        async def general_query(*args):
+            general_calls.append(args)
+
+        router._handle_general_query = general_query
+
+        agent_type, params, _ = await router._classify_with_speculation(
+            message, None, conversation, {}
+        )
+
+        assert agent_type == AgentType.COMPANY_RESEARCH
+        assert params["company_name"] == "Acme"
+        assert router._routing_llm.calls == 1
+        assert not general_calls
+        assert not any(agent.prepared for agent in agents.values())
+
+    def test_only_agents_with_prepare_are_speculated(self):
+        """Test that agents without a prepare() override are not started."""
+        assert ConversationRouter.SPECULATIVE_AGENTS == (AgentType.COMPANY_RESEARCH,)
@@ -0,0 +1,38 @@
+"""Tests for streaming helpers."""
+
+import asyncio
+
+from app.utils.streaming import TokenBatcher
+
+
+async def _tokens(items, delay: float = 0.0):
+    for item in items:
+        if delay:
+            await asyncio.sleep(delay)
+        yield item
+
+
+async def _collect(batcher: TokenBatcher) -> list:
+    return [item async for item in batcher]
+
+
+async def test_batches_by_size():
+    """Test that tokens are flushed once the batch is full."""
+    batcher = TokenBatcher(_tokens(list("abcdefghij")), max_batch=4, max_wait_ms=1000)
+
+    assert await _collect(batcher) == ["abcd", "efgh", "ij"]
+
+
+async def test_flushes_on_timeout():
+    """Test that a slow stream still flushes buffered tokens."""
+    batcher = TokenBatcher(_tokens(["a", "b"], delay=0.05), max_batch=8, max_wait_ms=10)
+
+    assert await _collect(batcher) == ["a", "b"]
+
+
+async def test_passes_through_non_string_items():
+    """Test that non-string items flush the buffer and pass through unchanged."""
+    final = object()
+    batcher = TokenBatcher(_tokens(["a", "b", final]), max_batch=8, max_wait_ms=1000)
+
+    assert await _collect(batcher) == ["ab", final]
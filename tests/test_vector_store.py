@@ -0,0 +1,138 @@
+"""Tests for the vector store service (no model downloads)."""
+
+from app.models.resume import Resume, ResumeSection, SectionType
+from app.services.vector_store import VectorStoreService
+from chromadb import Documents, EmbeddingFunction, Embeddings
+
+
+class _CountingEmbeddingFunction(EmbeddingFunction):
+    """Embedding stub that records which documents it embedded."""
+
+    def __init__(self):
+        self.calls: list[list[str]] = []
+
+    def __call__(self, input: Documents) -> Embeddings:
+        self.calls.append(list(input))
+        return [[float(len(doc)), 1.0, 0.5] for doc in input]
+
+    @staticmethod
+    def name() -> str:
+        return "counting"
+
+    def get_config(self) -> dict:
+        return {}
+
+    @staticmethod
+    def build_from_config(config: dict) -> "_CountingEmbeddingFunction":
+        return _CountingEmbeddingFunction()
+
+
+def _vector_store(tmp_path) -> VectorStoreService:
+    vector_store = VectorStoreService()
+    vector_store.settings = vector_store.settings.model_copy(
+        update={"chroma_persist_directory": str(tmp_path)}
+    )
+    vector_store._embedding_function = _CountingEmbeddingFunction()
+    return vector_store
+
+
+async def test_index_resume_reuses_embeddings_for_unchanged_content(tmp_path):
+    """Test that content indexed before is not embedded again."""
+    vector_store = _vector_store(tmp_path)
+    skills = [
+        ResumeSection(section_type=SectionType.SKILLS, title="Skills", content="Python")
+    ]
+
+    await vector_store.index_resume(
+        Resume(id="r1", user_id="u", filename="cv.pdf", raw_text="v1", sections=skills),
+        store_full=True,
+    )
+    await vector_store.index_resume(
+        Resume(id="r2", user_id="u", filename="cv.pdf", raw_text="v2", sections=skills),
+        store_full=True,
+    )
+
+    assert vector_store._embedding_function.calls == [["v1", "Python"], ["v2"]]
+
+
+async def test_index_resume_embeds_sections_only_by_default(tmp_path):
+    """Test that the whole resume text is not embedded alongside its sections."""
+    vector_store = _vector_store(tmp_path)
+    skills = [
+        ResumeSection(section_type=SectionType.SKILLS, title="Skills", content="Python")
+    ]
+
+    await vector_store.index_resume(
+        Resume(id="r1", user_id="u", filename="cv.pdf", raw_text="v1", sections=skills)
+    )
+
+    assert vector_store._embedding_function.calls == [["Python"]]
+
+
+async def test_reindexing_replaces_the_resume_documents(tmp_path):
+    """Test that re-indexing updates changed sections and drops removed ones."""
+    vector_store = _vector_store(tmp_path)
+    sections = [
+        ResumeSection(section_type=SectionType.SKILLS, title="Skills", content="Go"),
+        ResumeSection(section_type=SectionType.SUMMARY, title="About", content="Hi"),
+    ]
+    resume = Resume(id="r1", user_id="u", filename="cv.pdf", raw_text="cv")
+
+    await vector_store.index_resume(resume.model_copy(update={"sections": sections}))
+    sections = [sections[0].model_copy(update={"content": "Python"})]
+    await vector_store.index_resume(resume.model_copy(update={"sections": sections}))
+
+    stored = vector_store._get_or_create_collection("resumes").get()
+    assert stored["ids"] == ["r1_skills_0"]
+    assert stored["documents"] == ["Python"]
+
+
+def test_collection_handles_are_reused(tmp_path):
+    """Test that each collection is looked up from the client only once."""
+    vector_store = _vector_store(tmp_path)
+    first = vector_store._get_or_create_collection("resumes")
+
+    assert vector_store._get_or_create_collection("resumes") is first
+    assert vector_store._get_or_create_collection("companies") is not first
+
+
+async def test_search_returns_content_metadata_and_distance(tmp_path):
+    """Test that query results are flattened into one dict per hit."""
+    vector_store = _vector_store(tmp_path)
+    skills = [
+        ResumeSection(
+            section_type=SectionType.SKILLS, title="Skills", content="Python developer"
+        )
+    ]
+    await vector_store.index_resume(
+        Resume(id="r1", user_id="u", filename="cv.pdf", raw_text="cv", sections=skills)
+    )
+
+    results = await vector_store.search_resume_content("Python", resume_id="r1")
+    missing = await vector_store.search_resume_content("Python", resume_id="nope")
+
+    assert [r["content"] for r in results] == ["Python developer"]
+    assert results[0]["metadata"]["section_type"] == "skills"
+    assert isinstance(results[0]["distance"], float)
+    assert missing == []
+
+
+def test_migrate_collection_settings_rebuilds_without_re_embedding(tmp_path):
+    """Test that a legacy collection is rebuilt with its HNSW settings."""
+    vector_store = _vector_store(tmp_path)
+    legacy = vector_store.client.create_collection(
+        "resumes",
+        embedding_function=vector_store.embedding_function,
+        metadata={"hnsw:space": "cosine"},
+    )
+    legacy.add(ids=["a"], documents=["Python"], metadatas=[{"resume_id": "r1"}])
+    embedded = list(vector_store._embedding_function.calls)
+
+    assert vector_store.migrate_collection_settings() == ["resumes"]
+    assert vector_store.migrate_collection_settings() == []
+
+    collection = vector_store._get_or_create_collection("resumes")
+    hnsw = collection.configuration["hnsw"]
+    assert (hnsw["max_neighbors"], hnsw["ef_construction"]) == (32, 200)
+    assert collection.get(ids=["a"])["documents"] == ["Python"]
+    assert vector_store._embedding_function.calls == embedded